@@ -157,6 +157,16 @@ def main(  # pylint: disable=R0913,R0914
             " Treating __init__.py files like regular .py files."
         ),
     ),
+    jobs: int = typer.Option(
+        1,
+        "--jobs",
+        "-j",
+        show_default=True,
+        help=(
+            "Number of files to refactor in parallel (worker processes)."
+            " Zero means one job per CPU."
+        ),
+    ),
     version: bool = typer.Option(  # pylint: disable=W0613
         None,
         "--version",
@@ -180,11 +190,17 @@ def main(  # pylint: disable=R0913,R0914
         expand_stars=expand_stars,
         no_gitignore=no_gitignore,
         disable_all_dunder_policy=disable_all_dunder_policy,
+        jobs=jobs,
     )
     reporter = report.Report(configs)
     session_maker = refactor.Refactor(configs, reporter)
+    #: Sources to be refactored by one worker pool (`-j, --jobs`).
+    parallel_sources: List[Path] = []
     for path in configs.paths:
         if path == iou.STDIN_NOTATION:
+            if parallel_sources:
+                refactor.parallel_sessions(session_maker, parallel_sources)
+                parallel_sources = []
             sources: List[Path] = [iou.STDIN_FILE]
         else:
             gitignore = regexu.get_gitignore(
@@ -198,8 +214,13 @@ def main(  # pylint: disable=R0913,R0914
                 gitignore,
                 reporter,
             )
+            if configs.jobs > 1:
+                parallel_sources.extend(sources)
+                continue
         for source in sources:
             session_maker.session(source)
+    if parallel_sources:
+        refactor.parallel_sessions(session_maker, parallel_sources)
     # Print the report.
     typer.echo(str(reporter), nl=False)
     # Set the correct exit code and exit.
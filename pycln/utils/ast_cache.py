@@ -0,0 +1,121 @@
+"""Pycln persistent AST cache utility."""
+import ast
+import hashlib
+import os
+import pickle
+import stat
+import sys
+from pathlib import Path
+from typing import Optional, Union
+
+from .. import __version__
+
+# Constants.
+AST_CACHE_ENV = "PYCLN_AST_CACHE"
+PKL = ".pkl"
+
+#: The pickled trees are only valid for the exact interpreter
+#: and pycln release that produced them.
+_KEY_SALT = f"{__version__}\0{sys.version}\0".encode()
+
+
+def is_enabled() -> bool:
+    """Check whether the on-disk AST cache has been enabled.
+
+    :returns: True if `PYCLN_AST_CACHE=1` is set.
+    """
+    return os.environ.get(AST_CACHE_ENV, "") == "1"
+
+
+def get_key(source_code: Union[str, bytes]) -> str:
+    """Compute the cache key of the given `source_code`.
+
+    :param source_code: python source code.
+    :returns: SHA256 hex digest of the source, pycln version, and Python version.
+    """
+    if isinstance(source_code, str):
+        source_code = source_code.encode("utf-8", "surrogatepass")
+    return hashlib.sha256(_KEY_SALT + source_code).hexdigest()
+
+
+def get_cache_dir() -> Path:
+    """Get the on-disk AST cache directory.
+
+    Only resolved when the cache is used (`Path.home()` may fail).
+
+    :returns: `$XDG_CACHE_HOME/pycln/ast` or `~/.cache/pycln/ast`.
+    """
+    cache_home = os.environ.get("XDG_CACHE_HOME", "")
+    root = Path(cache_home) if cache_home else Path.home().joinpath(".cache")
+    return root.joinpath("pycln").joinpath("ast")
+
+
+def _get_path(cache_dir: Path, key: str) -> Path:
+    # `~/.cache/pycln/ast/<key[:2]>/<key>.pkl`.
+    return cache_dir.joinpath(key[:2]).joinpath(key + PKL)
+
+
+def is_trusted(cache_dir: Path) -> bool:
+    """Check whether the given `cache_dir` can be safely unpickled from.
+
+    Unpickling runs arbitrary code, so the directory must be owned by
+    the current user and must not be writable by the group or others.
+
+    :param cache_dir: the cache directory (`get_cache_dir`).
+    :returns: True if no other user can write to `cache_dir`.
+    :raises OSError: if `cache_dir` can't be stat'ed.
+    """
+    if not hasattr(os, "getuid"):
+        #: Windows: no POSIX ownership/mode bits (ACLs protect the profile).
+        return True  # pragma: nocover
+    st = os.stat(cache_dir)
+    if st.st_uid != os.getuid():
+        return False
+    return not st.st_mode & (stat.S_IWGRP | stat.S_IWOTH)
+
+
+def load(key: str) -> Optional[ast.AST]:
+    """Load a cached AST.
+
+    :param key: a key computed by `get_key`.
+    :returns: the cached `ast.AST` or None on cache miss.
+    """
+    try:
+        cache_dir = get_cache_dir()
+        if not is_trusted(cache_dir):
+            return None
+        with open(_get_path(cache_dir, key), "rb") as f:
+            tree = pickle.load(f)
+    except Exception:  # pylint: disable=broad-except
+        #: Any unreadable/corrupted/stale pickle (or a missing home
+        #: directory) is just a cache miss.
+        return None
+    return tree if isinstance(tree, ast.AST) else None
+
+
+def store(key: str, tree: ast.AST) -> None:
+    """Store the given `tree` (failures are silently ignored).
+
+    :param key: a key computed by `get_key`.
+    :param tree: the parsed `ast.AST` to cache.
+    """
+    try:
+        cache_dir = get_cache_dir()
+    except RuntimeError:
+        #: No home directory to hold the cache.
+        return
+    path = _get_path(cache_dir, key)
+    tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        #: Private to the current user, see `is_trusted`.
+        cache_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+        path.parent.mkdir(exist_ok=True)
+        with open(tmp_path, "wb") as f:
+            pickle.dump(tree, f, protocol=pickle.HIGHEST_PROTOCOL)
+        #: Atomic rename, concurrent runs never read a partial pickle.
+        os.replace(tmp_path, path)
+    except (OSError, pickle.PicklingError, RecursionError):
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
@@ -1,6 +1,7 @@
 """Pycln configuration management utility."""
 import configparser
 import json
+import os
 import tokenize
 from dataclasses import dataclass
 from pathlib import Path
@@ -37,6 +38,7 @@ class Config:
             self._check_regex()
             self._parse_skip_imports()
             self._check_skip_imports()
+            self._check_jobs()
 
     paths: List[Path]
     skip_imports: Set[str]
@@ -53,6 +55,7 @@ class Config:
     expand_stars: bool = False
     no_gitignore: bool = False
     disable_all_dunder_policy: bool = False
+    jobs: int = 1
 
     def _parse_skip_imports(self) -> None:
         #: Converts "x,y,z" syntax into {"x", "y", "z"} set.
@@ -98,6 +101,22 @@ class Config:
                 )
                 raise typer.Exit(1)
 
+    def _check_jobs(self) -> None:
+        # Validate `self.jobs` (0 means one job per CPU).
+        try:
+            self.jobs = int(self.jobs)
+            if self.jobs < 0:
+                raise ValueError
+        except (TypeError, ValueError):
+            typer.secho(
+                f"--jobs: {self.jobs!r} is not a valid number of jobs! 😅",
+                bold=True,
+                err=True,
+            )
+            raise typer.Exit(1)
+        if self.jobs == 0:
+            self.jobs = os.cpu_count() or 1
+
     def _check_regex(self) -> None:
         # Validate `self.include/exclude/extend_exclude`.
         self.include: Pattern[str] = regexu.safe_compile(
@@ -96,6 +96,36 @@ def safe_read(
         raise UnparsableFile(path, err) from err
 
 
+def safe_read_bytes(path: Path) -> bytes:
+    """Read file content as raw bytes (without decoding).
+
+    Meant for sources that are only parsed (`ast.parse` handles both
+    BOMs and encoding cookies), not rewritten.
+
+    :param path: `.py` file path.
+    :returns: undecoded source code.
+    :raises ReadPermissionError: when the source does not have read permission.
+    :raises InitFileDoesNotExistError: when `path` is a path to a non-existing
+        `__init__.py` file.
+    :raises OSError: any other `open` failure (e.g. `FileNotFoundError`,
+        `IsADirectoryError`).
+    """
+    #: No `os.access`/`path.exists` pre-checks, the `open`
+    #: failure tells which case it is (one syscall less per file).
+    try:
+        with open(path, "rb") as f:
+            return f.read()
+    except PermissionError as err:
+        raise ReadPermissionError(13, "Permission denied [READ]", path) from err
+    except FileNotFoundError as err:
+        # Check for a non-existing `__init__.py` file case.
+        if str(path).endswith(__INIT__):
+            raise InitFileDoesNotExistError(
+                2, "`__init__.py` file does not exist", path
+            ) from err
+        raise
+
+
 def safe_write(path: Path, fixed_lines: List[str], encoding: str, newline: str) -> None:
     """Write file content based on given `encoding`.
 
@@ -4,7 +4,7 @@ import sys
 import sysconfig
 from functools import lru_cache
 from pathlib import Path
-from typing import Generator, Optional, Pattern, Set, Tuple
+from typing import FrozenSet, Generator, Optional, Pattern, Set, Tuple
 
 from pathspec import PathSpec
 
@@ -26,22 +26,24 @@ SITE_PACKAGES = "site-packages"
 DIST_PACKAGES = "dist-packages"
 LIB_PY_EXTENSIONS = ("so", "py", "pyc")
 BIN_PY_EXTENSIONS = ("so", "egg-info", "nspkg.pth")
-BIN_IMPORTS = {  # In case they are built into CPython.
-    "io",
-    "os",
-    "sys",
-    "grp",
-    "pwd",
-    "json",
-    "math",
-    "time",
-    "parser",
-    "string",
-    "operator",
-    "datetime",
-    "multiprocessing",
-}
-IMPORTS_WITH_SIDE_EFFECTS = {"this", "antigravity", "rlcompleter"}
+BIN_IMPORTS = frozenset(  # In case they are built into CPython.
+    {
+        "io",
+        "os",
+        "sys",
+        "grp",
+        "pwd",
+        "json",
+        "math",
+        "time",
+        "parser",
+        "string",
+        "operator",
+        "datetime",
+        "multiprocessing",
+    }
+)
+IMPORTS_WITH_SIDE_EFFECTS = frozenset({"this", "antigravity", "rlcompleter"})
 PYTHON_STDLIB_PATHS = frozenset(
     {sysconfig.get_path("platstdlib"), sysconfig.get_path("stdlib")}
 )
@@ -149,10 +151,11 @@ def get_standard_lib_paths() -> Set[Path]:
 
 
 @lru_cache()
-def get_standard_lib_names() -> Set[str]:
+def get_standard_lib_names() -> FrozenSet[str]:
     """Returns a set of Python standard library modules names.
 
-    :returns: a set of Python standard library modules names.
+    :returns: a frozenset of Python standard library modules names
+        (cached, shared by all callers).
     """
     names: Set[str] = set()
     paths: Set[Path] = get_standard_lib_paths()
@@ -168,7 +171,7 @@ def get_standard_lib_names() -> Set[str]:
 
         names.add(name.split(".")[0])
 
-    return (names - IMPORTS_WITH_SIDE_EFFECTS) | BIN_IMPORTS
+    return frozenset((names - IMPORTS_WITH_SIDE_EFFECTS) | BIN_IMPORTS)
 
 
 @lru_cache()
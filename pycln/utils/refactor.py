@@ -1,7 +1,9 @@
 """Pycln code refactoring utility."""
 import ast
+import io
 import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from importlib import import_module
 from typing import Iterable, List, Optional, Set, Tuple, Union, cast
 
@@ -34,6 +36,10 @@ NOPYCLN = "nopycln"
 CHANGE_MARK = "\n_CHANGED_"
 TRANSFORM = ".transform"
 PYCLN_UTILS = "pycln.utils"
+STMT_LIST_FIELDS = ("body", "orelse", "finalbody", "handlers", "cases")
+DEF_TYPES = (ast.AsyncFunctionDef, ast.FunctionDef, ast.ClassDef)
+#: Number of paths sent to a worker process at once (see `parallel_sessions`).
+JOBS_CHUNKSIZE = 8
 
 
 class PyPath(Path):
@@ -112,11 +118,9 @@ class Refactor:
         :returns: clean source code lines.
         """
 
-        def remove_from_children(
-            parent: ast.AST, children: Iterable, body_len: int, wl: Set[ast.AST]
-        ):
-            #: Remove any `ast.Pass` node
-            #: that is both useless and not in the `wl` (white list).
+        def remove_from_children(parent: ast.AST, children: List[ast.AST]):
+            #: Remove any `ast.Pass` node that is useless
+            #: (the only statement of a block is never removed).
             #:
             #: The case below is not going to be touched:
             #:
@@ -124,38 +128,27 @@ class Refactor:
             #: >>>      """DOCString"""
             #: >>>      pass
             #:
+            body_len = len(children)
             for child in children:
                 if isinstance(child, ast.Pass):
-                    if child not in wl:
-                        if isinstance(
-                            parent,
-                            (ast.AsyncFunctionDef, ast.FunctionDef, ast.ClassDef),
-                        ):
-                            if body_len == 2 and ast.get_docstring(parent):
-                                break
-                        if body_len > 1:
-                            body_len -= 1
-                            source_lines[child.lineno - 1] = ""
+                    if isinstance(parent, DEF_TYPES):
+                        if body_len == 2 and ast.get_docstring(parent):  # type: ignore
+                            break
+                    if body_len > 1:
+                        body_len -= 1
+                        source_lines[child.lineno - 1] = ""
 
         tree = ast.parse("".join(source_lines))
-        for parent in ast.walk(tree):
-            body = getattr(parent, "body", None)
-            if body and hasattr(body, "__len__"):
-                body_len = len(body)
-                white_list: Set[ast.AST] = set()
-
-                if hasattr(parent, "orelse"):
-                    orelse = getattr(parent, "orelse")
-                    remove_from_children(parent, orelse, len(orelse), white_list)
-                    white_list |= set(orelse)
-
-                if hasattr(parent, "finalbody"):
-                    finalbody = getattr(parent, "finalbody")
-                    remove_from_children(parent, finalbody, len(finalbody), white_list)
-                    white_list |= set(finalbody)
-
-                children = ast.iter_child_nodes(parent)
-                remove_from_children(parent, children, body_len, white_list)
+        parents: List[ast.AST] = [tree]
+        while parents:
+            parent = parents.pop()
+            #: A `pass` can only be a statement, so only statement lists
+            #: are walked (expression nodes are never visited).
+            for field in STMT_LIST_FIELDS:
+                children = getattr(parent, field, None)
+                if children:
+                    parents.extend(children)
+                    remove_from_children(parent, children)
 
         return "".join(source_lines).splitlines(True)
 
@@ -500,7 +493,7 @@ class Refactor:
         else:
             # Handle imports like (import os.path, from os import path.join).
             return self._has_used(name[0], is_star) and all(
-                [name in self._source_stats.attr_ for name in name[1:]]
+                name in self._source_stats.attr_ for name in name[1:]
             )
 
     def _has_side_effects(  # pylint: disable=dangerous-default-value
@@ -527,9 +520,8 @@ class Refactor:
             return cached_result  # pragma: nocover
 
         try:
-            code, _, _ = iou.safe_read(module_source, permissions=(os.R_OK,))
-            tree = scan.parse_ast(code, module_source)
-        except (ReadPermissionError, UnparsableFile) as err:
+            tree = scan.parse_file(module_source)
+        except (ReadPermissionError, UnparsableFile, OSError) as err:
             self.reporter.failure(str(err))
             assumption = scan.HasSideEffects.NOT_KNOWN
             cache[module_source] = assumption
@@ -587,3 +579,68 @@ class Refactor:
                 index += 1
 
         return fixed_lines
+
+
+class _CapturedStream(io.StringIO):
+
+    """A `sys.stdout/stderr` replacement (for worker processes) that keeps
+    the parent stream TTY state, so the captured messages are styled the
+    same way they would have been printed by the parent process.
+    """
+
+    def __init__(self, is_tty: bool):
+        super().__init__()
+        self._is_tty = is_tty
+
+    def isatty(self) -> bool:
+        return self._is_tty
+
+
+#: Worker process state (see `_init_worker`).
+_worker_configs: Optional[Config] = None
+_worker_ttys = (False, False)
+
+
+def _init_worker(configs: Config, ttys: Tuple[bool, bool]) -> None:
+    global _worker_configs, _worker_ttys  # pylint: disable=global-statement
+    _worker_configs, _worker_ttys = configs, ttys
+
+
+def _worker_session(path: Path) -> Tuple[Tuple[int, ...], str, str]:
+    # Refactor the given `path` with its own `Report` while capturing
+    # its output, to be merged (in order) by the parent process.
+    out, err = _CapturedStream(_worker_ttys[0]), _CapturedStream(_worker_ttys[1])
+    stdout, stderr = sys.stdout, sys.stderr
+    sys.stdout, sys.stderr = out, err
+    try:
+        reporter = Report(cast(Config, _worker_configs))
+        Refactor(cast(Config, _worker_configs), reporter).session(path)
+        reporter.flush()
+    finally:
+        sys.stdout, sys.stderr = stdout, stderr
+    return reporter.counters, out.getvalue(), err.getvalue()
+
+
+def parallel_sessions(session_maker: Refactor, sources: Iterable[Path]) -> None:
+    """Refactor the given `sources` using `session_maker.configs.jobs` processes.
+
+    The output of each source is printed in the same order as `sources`.
+
+    :param session_maker: a `Refactor` instance (its reporter gets the results).
+    :param sources: `.py` files to refactor.
+    """
+    sources = list(sources)
+    if len(sources) < 2:
+        for source in sources:
+            session_maker.session(source)
+        return
+    reporter = session_maker.reporter
+    with ProcessPoolExecutor(
+        max_workers=min(session_maker.configs.jobs, len(sources)),
+        initializer=_init_worker,
+        initargs=(session_maker.configs, (sys.stdout.isatty(), sys.stderr.isatty())),
+    ) as executor:
+        for counters, out, err in executor.map(
+            _worker_session, sources, chunksize=JOBS_CHUNKSIZE
+        ):
+            reporter.merge(counters, out, err)
@@ -1,16 +1,106 @@
 """Pycln report utility."""
 import ast
-from dataclasses import dataclass
-from difflib import unified_diff
+import re
+import sys
 from pathlib import Path
-from typing import List, Optional, Union
+from typing import List, Match, Optional, Tuple, Union
 
 import typer
 
 from . import _nodes, config
 
+#: Diff line first character to its (precomputed) ANSI color prefix.
+_STYLE_BY_CHAR = {
+    "-": typer.style("", fg=typer.colors.RED, reset=False),
+    "+": typer.style("", fg=typer.colors.GREEN, reset=False),
+    "@": typer.style("", fg=typer.colors.CYAN, reset=False),
+}
+_STYLE_RESET = typer.style("", reset=True)
+
+#: Buffered report messages size (in chars) that triggers a flush.
+_FLUSH_THRESHOLD = 64 * 1024
+
+#: Diff lines to be colored (see `_STYLE_BY_CHAR`).
+_STYLED_LINE_REGEX = re.compile(r"^[-+@].*", re.M)
+_STYLE_BOLD = typer.style("", bold=True, reset=False)
+_STYLE_BY_BOLD = {
+    True: _STYLE_BOLD,
+    False: typer.style("", bold=False, reset=False),
+}
+
+#: `str(Report)` counter verbs as `(singular, plural)` pairs.
+_COMMON_VERBS = {
+    "failed": ("has failed to be cleaned", "have failed to be cleaned"),
+    "ignored": ("was ignored", "were ignored"),
+}
+_CHECK_VERBS = {
+    "removed": ("would be removed", "would be removed"),
+    "expanded": ("would be expanded", "would be expanded"),
+    "changed": ("would be changed", "would be changed"),
+    "unchanged": ("would be left unchanged", "would be left unchanged"),
+    "skipped": ("would be skipped", "would be skipped"),
+    **_COMMON_VERBS,
+}
+_APPLY_VERBS = {
+    "removed": ("was removed", "were removed"),
+    "expanded": ("was expanded", "were expanded"),
+    "changed": ("was changed", "were changed"),
+    "unchanged": ("left unchanged", "left unchanged"),
+    "skipped": ("was skipped", "were skipped"),
+    **_COMMON_VERBS,
+}
+
+#: `Report.ignored_path` ignore type to its reason.
+_IGNORE_REASONS = {
+    "exclude": "matches the --exclude regex",
+    "gitignore": "matches the .gitignore patterns",
+    "include": "does not match the --include regex",
+}
+_SHARP = "#"  # To no skip this file.
+_NOPYCLN_REASON = f"do to `{_SHARP} nopycln: file` comment"
+
+#: `Report.ignored_import` reasons.
+_NOQA_REASON = "`# noqa` or `# nopycln: import`"
+_STAR_REASON = "cannot expand the '*'"
+
+#: `Report.init_without_all_warning` message (`{}` is the file path).
+_INIT_WITHOUT_ALL_MSG = """
+        Pycln can not decide whether the unused imported names
+        are useless or imported to be used somewhere else (exported).
+
+        Please consider adding an `__all__` dunder (then re-run Pycln).
+
+        For more info:
+        https://hadialqattan.github.io/pycln/#/?id=init-file-__init__py
+        """
+_INIT_WITHOUT_ALL_TEMPLATE = "{} file has been skipped ⚠️:\n" + _INIT_WITHOUT_ALL_MSG
+
+#: `Report.secho` message kind to its colored margin.
+_MARGIN_BY_KIND = {
+    kind: typer.style(" ", bg=color) + " "
+    for kind, color in (
+        ("edit", typer.colors.BRIGHT_BLUE),
+        ("success", typer.colors.BRIGHT_GREEN),
+        ("warning", typer.colors.BRIGHT_YELLOW),
+        ("error", typer.colors.BRIGHT_RED),
+    )
+}
+#: `Report.secho` message kinds that go to stderr.
+_STDERR_KINDS = frozenset({"warning", "error"})
+
+#: `Report` total counters (see `Report.counters` and `Report.merge`).
+_TOTAL_COUNTERS = (
+    "_removed_imports",
+    "_expanded_stars",
+    "_changed_files",
+    "_unchanged_files",
+    "_ignored_paths",
+    "_ignored_imports",
+    "_failures",
+    "_undecidable_case",
+)
+
 
-@dataclass
 class Report:
 
     """Provide a Pycln report counters.
@@ -18,8 +108,83 @@ class Report:
     Can be rendered with `str(report)`.
     """
 
-    #: Configured instance.
-    configs: config.Config
+    __slots__ = (
+        "configs",
+        "_check",
+        "_diff",
+        "_verbose",
+        "_quiet",
+        "_silence",
+        "_print_edits",
+        "_removed_word",
+        "_expanded_word",
+        "_removed_suffix",
+        "_expanded_suffix",
+        "_str_cache",
+        "_out_tty",
+        "_err_tty",
+        "_out_buf",
+        "_err_buf",
+        "_buf_size",
+        "_removed_imports",
+        "_expanded_stars",
+        "_changed_files",
+        "_file_removed_imports",
+        "_file_expanded_stars",
+        "_file_failed",
+        "_unchanged_files",
+        "_ignored_paths",
+        "_ignored_imports",
+        "_failures",
+        "_undecidable_case",
+    )
+
+    def __init__(self, configs: config.Config):
+        #: Configured instance.
+        self.configs = configs
+        # Hoist the frequently read flags out of `self.configs`.
+        self._check = self.configs.check
+        self._diff = self.configs.diff
+        self._verbose = self.configs.verbose
+        self._quiet = self.configs.quiet
+        self._silence = self.configs.silence
+        #: Whether removed/expanded import messages are printed.
+        self._print_edits = not (self._diff or self._quiet or self._silence)
+        #: Per-event verbs (constant for the whole run).
+        self._removed_word = "would be removed" if self._check else "was removed"
+        self._expanded_word = "would be expanded" if self._check else "was expanded"
+        self._removed_suffix = f" {self._removed_word}! 🔮"
+        self._expanded_suffix = f" {self._expanded_word}! 🔗"
+        #: Rendered `str(self)`, dropped on any counter mutation.
+        self._str_cache: Optional[str] = None
+        #: Whether stdout/stderr are terminals (styled and unbuffered).
+        self._out_tty = sys.stdout.isatty()
+        self._err_tty = sys.stderr.isatty()
+        #: Pending stdout/stderr messages (see `self.flush`).
+        self._out_buf: List[str] = []
+        self._err_buf: List[str] = []
+        self._buf_size = 0
+
+        #: Total removed import statements counter.
+        self._removed_imports = 0
+        #: Total expanded import statements counter.
+        self._expanded_stars = 0
+        #: Total changed files counter.
+        self._changed_files = 0
+        #: These counters will be reseted for each file.
+        self._file_removed_imports = 0
+        self._file_expanded_stars = 0
+        self._file_failed = False
+        #: Total unchanged files counter.
+        self._unchanged_files = 0
+        #: Total ignored paths counter.
+        self._ignored_paths = 0
+        #: Total ignored import statements counter.
+        self._ignored_imports = 0
+        #: Total number of failures.
+        self._failures = 0
+        #: Total number of undecidable cases
+        self._undecidable_case = 0
 
     @staticmethod
     def get_location(path: Path, location: _nodes.NodeLocation) -> str:
@@ -30,43 +195,74 @@ class Report:
         :returns: full location.
         """
         start = location.start
-        line, col = str(start.line), str(start.col)
-        return ":".join([str(path), line, col])
+        return f"{path}:{start.line}:{start.col}"
 
-    @staticmethod
     def secho(
+        self,
         message: str,
         *,  # Force kwargs.
         bold: bool,
-        isedit: bool = False,
-        issuccess: bool = False,
-        iswarning: bool = False,
-        iserror: bool = False,
+        kind: str,
     ) -> None:
-        """Print a colored message.
+        """Print a colored message (buffered unless printing to a TTY).
 
         :param message: a string message.
         :param bold: is if a bold message.
-        :param isedit: is it an edit message ~> stdout.
-        :param issuccess: is it a success message  ~> stdout.
-        :param iswarning: is it a warning message ~> stderr.
-        :param iserror: is it an error message ~> stderr.
+        :param kind: `edit`/`success` ~> stdout, `warning`/`error` ~> stderr.
         """
-        if isedit:
-            color = typer.colors.BRIGHT_BLUE
-        elif issuccess:
-            color = typer.colors.BRIGHT_GREEN
-        elif iswarning:
-            color = typer.colors.BRIGHT_YELLOW
-        elif iserror:
-            color = typer.colors.BRIGHT_RED
+        margin = _MARGIN_BY_KIND.get(kind)
+        if margin is None:
+            raise ValueError(f"Unknown message kind: {kind!r}.")
+        if kind in _STDERR_KINDS:
+            buf, is_tty = self._err_buf, self._err_tty
         else:
-            raise ValueError("Please specify one of the is* args.")
-        # Print the colored message
-        typer.echo(
-            typer.style(" ", bg=color) + " " + typer.style(message, bold=bold),
-            err=bool(iswarning or iserror),
-        )
+            buf, is_tty = self._out_buf, self._out_tty
+        # Styles would be stripped anyway on non-TTY streams.
+        if is_tty:
+            message = margin + _STYLE_BY_BOLD[bold] + message + _STYLE_RESET
+        else:
+            message = "  " + message
+        buf.append(message + "\n")
+        self._buf_size += len(message) + 1
+        # Keep terminals interactive; batch the writes otherwise.
+        if is_tty or self._buf_size > _FLUSH_THRESHOLD:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write out the buffered stdout/stderr messages."""
+        self._buf_size = 0
+        if self._out_buf:
+            typer.echo("".join(self._out_buf), nl=False)
+            self._out_buf.clear()
+        if self._err_buf:
+            typer.echo("".join(self._err_buf), nl=False, err=True)
+            self._err_buf.clear()
+
+    @property
+    def counters(self) -> Tuple[int, ...]:
+        """Return the total counters (ordered as `_TOTAL_COUNTERS`).
+
+        :returns: a tuple of the total counters.
+        """
+        return tuple(getattr(self, name) for name in _TOTAL_COUNTERS)
+
+    def merge(self, counters: Tuple[int, ...], out: str = "", err: str = "") -> None:
+        """Merge another report results (e.g. from a worker process).
+
+        :param counters: the other report `counters`.
+        :param out: the other report already rendered stdout messages.
+        :param err: the other report already rendered stderr messages.
+        """
+        for name, count in zip(_TOTAL_COUNTERS, counters):
+            setattr(self, name, getattr(self, name) + count)
+        self._str_cache = None
+        if out:
+            self._out_buf.append(out)
+        if err:
+            self._err_buf.append(err)
+        self._buf_size += len(out) + len(err)
+        if self._out_tty or self._err_tty or self._buf_size > _FLUSH_THRESHOLD:
+            self.flush()
 
     @staticmethod
     def colored_unified_diff(
@@ -80,6 +276,9 @@ class Report:
         :param original_lines: original source code lines.
         :param fixed_lines: fixed soruce code lines.
         """
+        # Only needed with `--diff`; keep it off the startup path.
+        from difflib import unified_diff
+
         diff_gen = unified_diff(
             original_lines,
             fixed_lines,
@@ -88,26 +287,26 @@ class Report:
             n=3,
             lineterm="\n",
         )
-        diff_str = ""
-        for line in diff_gen:
-            if line.startswith("-"):
-                line = typer.style(line, fg=typer.colors.RED)
-            elif line.startswith("+"):
-                line = typer.style(line, fg=typer.colors.GREEN)
-            elif line.startswith("@"):
-                line = typer.style(line, fg=typer.colors.CYAN)
-            diff_str += line
+        diff_str = "".join(diff_gen)
+        if sys.stdout.isatty():
+            # Color the whole diff in one pass of the regex engine.
+            diff_str = _STYLED_LINE_REGEX.sub(Report._style_diff_line, diff_str)
         diff_str = diff_str.rstrip("\n ") + "\n"
         typer.echo(diff_str)
 
+    @staticmethod
+    def _style_diff_line(match: Match[str]) -> str:
+        line = match.group()
+        return _STYLE_BY_CHAR[line[0]] + line + _STYLE_RESET
+
     @staticmethod
     def output_stdin_to_stdout(fixed_lines: List[str]) -> None:
         """Printout the given fixed lines to STDOUT.
 
         :param fixed_lines: fixed soruce code lines.
         """
-        formatted_code = "".join(fixed_lines)
-        typer.echo(formatted_code, nl=False)
+        sys.stdout.writelines(fixed_lines)
+        sys.stdout.flush()
 
     @staticmethod
     def rebuild_report_import(
@@ -127,9 +326,6 @@ class Report:
         )
         return f"{str_import} {str_alias}"
 
-    #: Total removed import statements counter.
-    _removed_imports: int = 0
-
     def removed_import(
         self,
         path: Path,
@@ -142,21 +338,19 @@ class Report:
         :param node: removed import node.
         :param removed_alias: the removed `ast.alias` from the node.
         """
-        if not any([self.configs.diff, self.configs.quiet, self.configs.silence]):
-            location = Report.get_location(path, node.location)
-            statement = Report.rebuild_report_import(node, removed_alias)
-            removed = "would be removed" if self.configs.check else "was removed"
-            Report.secho(
-                f"{location} {statement!r} {removed}! 🔮",
-                bold=False,
-                isedit=True,
-            )
-
+        self._str_cache = None
         self._removed_imports += 1
-        self._file_removed_imports += 1 if self._file_removed_imports != -1 else 2
-
-    #: Total expanded import statements counter.
-    _expanded_stars: int = 0
+        self._file_removed_imports += 1
+        if not self._print_edits:
+            return
+
+        location = Report.get_location(path, node.location)
+        statement = Report.rebuild_report_import(node, removed_alias)
+        self.secho(
+            f"{location} {statement!r}{self._removed_suffix}",
+            bold=False,
+            kind="edit",
+        )
 
     def expanded_star(self, path: Path, node: _nodes.ImportFrom) -> None:
         """Increment `self._expanded_stars`. Write a message to stdout.
@@ -164,71 +358,65 @@ class Report:
         :param path: where the import was expanded.
         :param node: the expanded node.
         """
-        if not any([self.configs.diff, self.configs.quiet, self.configs.silence]):
-            location = Report.get_location(path, node.location)
-            star_alias = ast.alias(name="*", asname=None)
-            statement = Report.rebuild_report_import(node, star_alias)
-            expanded = "would be expanded" if self.configs.check else "was expanded"
-            Report.secho(
-                f"{location} {statement!r} {expanded}! 🔗",
-                bold=False,
-                isedit=True,
-            )
-
+        self._str_cache = None
         self._expanded_stars += 1
-        self._file_expanded_stars += 1 if self._file_expanded_stars != -1 else 2
-
-    #: Total changed files counter.
-    _changed_files: int = 0
-
-    #: These counters will be reseted for each file.
-    _file_removed_imports: int = 0
-    _file_expanded_stars: int = 0
+        self._file_expanded_stars += 1
+        if not self._print_edits:
+            return
+
+        location = Report.get_location(path, node.location)
+        star_alias = ast.alias(name="*", asname=None)
+        statement = Report.rebuild_report_import(node, star_alias)
+        self.secho(
+            f"{location} {statement!r}{self._expanded_suffix}",
+            bold=False,
+            kind="edit",
+        )
 
     def _reset_file_counters(self) -> None:
         self._file_removed_imports = 0
         self._file_expanded_stars = 0
+        self._file_failed = False
 
     def changed_file(self, path: Path) -> None:
         """Increment `self._changed_files`. Write a message to stdout.
 
         :param path: the changed file path.
         """
-        if not any([self.configs.diff, self.configs.silence]):
-            file_report: List[str] = []
-
-            if self._file_removed_imports > 0:
-                removed = "would be removed" if self.configs.check else "was removed"
-                s = "s" if self._file_removed_imports > 1 else ""
-                file_report.append(f"{self._file_removed_imports} import{s} {removed}")
-
-            if self._file_expanded_stars > 0:
-                expanded = "would be expanded" if self.configs.check else "was expanded"
-                s = "s" if self._file_expanded_stars > 1 else ""
-                file_report.append(f"{self._file_expanded_stars} import{s} {expanded}")
-
-            str_file_report = ", ".join(file_report)
-            Report.secho(f"{path} {str_file_report}! 🚀", bold=True, isedit=True)
-
+        self._str_cache = None
         self._changed_files += 1
-        self._reset_file_counters()
+        if not (self._diff or self._silence):
+            removed = self._file_removed_imports
+            expanded = self._file_expanded_stars
+            # Format directly; both counters are rarely set for the same file.
+            str_file_report = (
+                f"{removed} import{'s' if removed > 1 else ''} {self._removed_word}"
+                if removed > 0
+                else ""
+            )
+            if expanded > 0:
+                str_file_report += (
+                    f"{', ' if str_file_report else ''}"
+                    f"{expanded} import{'s' if expanded > 1 else ''} "
+                    f"{self._expanded_word}"
+                )
+            self.secho(f"{path} {str_file_report}! 🚀", bold=True, kind="edit")
 
-    #: Total unchanged files counter.
-    _unchanged_files: int = 0
+        self._reset_file_counters()
+        self.flush()
 
     def unchanged_file(self, path: Path) -> None:
         """Increment `self._unchanged_files`. Write a message to stdout.
 
         :param path: the unchanged file path.
         """
-        if self.configs.verbose and self._file_removed_imports != -1:
-            Report.secho(f"{path} looks good! ✨", bold=False, issuccess=True)
-
+        self._str_cache = None
         self._unchanged_files += 1
-        self._reset_file_counters()
+        if self._verbose and not self._file_failed:
+            self.secho(f"{path} looks good! ✨", bold=False, kind="success")
 
-    #: Total ignored paths counter.
-    _ignored_paths: int = 0
+        self._reset_file_counters()
+        self.flush()
 
     def ignored_path(self, ignored_path: Path, type_: str) -> None:
         """Increment `self._ignored_paths`. Write a message to stderr.
@@ -236,26 +424,17 @@ class Report:
         :param ignored_path: the ignored path.
         :param type_: ignore type (`exclude`, `include`, `gitignore` or `nopycln`).
         """
-        if self.configs.verbose:
-            if type_ == "exclude":
-                type_ = "matches the --exclude regex"  # pragma: nocover.
-            elif type_ == "gitignore":
-                type_ = "matches the .gitignore patterns"  # pragma: nocover.
-            elif type_ == "include":
-                type_ = "does not match the --include regex"  # pragma: nocover.
-            else:
-                sharp = "#"  # To no skip this file.
-                type_ = f"do to `{sharp} nopycln: file` comment"
-            Report.secho(
-                f"{ignored_path} was ignored: {type_}! ⚠️",
-                bold=False,
-                iswarning=True,
-            )
-
+        self._str_cache = None
         self._ignored_paths += 1
-
-    #: Total ignored import statements counter.
-    _ignored_imports: int = 0
+        if not self._verbose:
+            return
+
+        reason = _IGNORE_REASONS.get(type_, _NOPYCLN_REASON)
+        self.secho(
+            f"{ignored_path} was ignored: {reason}! ⚠️",
+            bold=False,
+            kind="warning",
+        )
 
     def ignored_import(
         self,
@@ -269,23 +448,19 @@ class Report:
         :param node: the ignored import node.
         :param is_star: set to true if it's a '*' import.
         """
-        if self.configs.verbose:
-            location = Report.get_location(path, node.location)
-            statement = Report.rebuild_report_import(node, node.names[0]) + ("." * 3)
-            reason = (
-                "`# noqa` or `# nopycln: import`"
-                if not is_star
-                else "cannot expand the '*'"
-            )
-            Report.secho(
-                f"{location} {statement!r} was ignored: {reason}! ⚠️",
-                bold=False,
-                iswarning=True,
-            )
+        self._str_cache = None
         self._ignored_imports += 1
-
-    #: Total number of failures.
-    _failures: int = 0
+        if not self._verbose:
+            return
+
+        location = Report.get_location(path, node.location)
+        statement = Report.rebuild_report_import(node, node.names[0]) + "..."
+        reason = _STAR_REASON if is_star else _NOQA_REASON
+        self.secho(
+            f"{location} {statement!r} was ignored: {reason}! ⚠️",
+            bold=False,
+            kind="warning",
+        )
 
     def failure(self, msg: str, path: Optional[Path] = None) -> None:
         """Increment `self._failures`. Write a msg to stderr.
@@ -293,37 +468,31 @@ class Report:
         :param msg: a failure msg.
         :param path: where the failure has appeared.
         """
-        if not self.configs.silence:
-            message = f"{path} {msg} ⛔" if path else f"{msg} ⛔"
-            Report.secho(message, bold=False, iserror=True)
-        if self._file_removed_imports == 0:
-            self._file_removed_imports = -1
+        self._str_cache = None
+        self._file_failed = True
         self._failures += 1
+        if self._silence:
+            return
 
-    #: Total number of undecidable cases
-    _undecidable_case: int = 0
+        message = f"{path} {msg} ⛔" if path else f"{msg} ⛔"
+        self.secho(message, bold=False, kind="error")
+        self.flush()
 
     def init_without_all_warning(self, path: Path) -> None:
         """Increment `self._undecidable_case`. Write a msg to stderr.
 
         :param path: the `__init__.py` file path.
         """
-        msg = """
-        Pycln can not decide whether the unused imported names
-        are useless or imported to be used somewhere else (exported).
-
-        Please consider adding an `__all__` dunder (then re-run Pycln).
-
-        For more info:
-        https://hadialqattan.github.io/pycln/#/?id=init-file-__init__py
-        """
-        if not self.configs.silence:
-            Report.secho(
-                f"{path} file has been skipped ⚠️:\n{msg}",
-                bold=False,
-                iswarning=True,
-            )
+        self._str_cache = None
         self._undecidable_case += 1
+        if self._silence:
+            return
+
+        self.secho(
+            _INIT_WITHOUT_ALL_TEMPLATE.format(path),
+            bold=False,
+            kind="warning",
+        )
 
     @property
     def exit_code(self) -> int:
@@ -334,7 +503,7 @@ class Report:
         # According to http://tldp.org/LDP/abs/html/exitcodes.html
         # exit codes 1 - 2, 126 - 165, and 255 have special meanings,
         # and should therefore be avoided for user-specified exit parameters
-        if self.configs.check:
+        if self._check:
             if self._failures:
                 # Internal error (check).
                 return 250
@@ -356,28 +525,13 @@ class Report:
         """
         return (  # pragma: nocover.
             "\n"
-            if any(
-                [
-                    self._changed_files,
-                    all(
-                        [
-                            self.configs.verbose,
-                            any([self._ignored_paths, self._ignored_imports]),
-                        ]
-                    ),
-                    all(
-                        [
-                            any(
-                                [
-                                    self._failures,
-                                    self._removed_imports,
-                                    self._expanded_stars,
-                                ]
-                            ),
-                            not self.configs.quiet,
-                        ]
-                    ),
-                ]
+            if (
+                self._changed_files
+                or (self._verbose and (self._ignored_paths or self._ignored_imports))
+                or (
+                    (self._failures or self._removed_imports or self._expanded_stars)
+                    and not self._quiet
+                )
             )
             else ""
         )
@@ -389,129 +543,49 @@ class Report:
 
         :returns: a colored report of the current state.
         """
-        if self.configs.silence:
+        self.flush()
+        if self._str_cache is None:
+            self._str_cache = self._render()
+        return self._str_cache
+
+    @staticmethod
+    def _render_count(
+        count: int, noun: str, verbs: Tuple[str, str], *, bold: bool
+    ) -> str:
+        plural = count > 1
+        fragment = f"{count} {noun}{'s' if plural else ''} {verbs[plural]}"
+        return f"{_STYLE_BOLD}{fragment}{_STYLE_RESET}" if bold else fragment
+
+    def _render(self) -> str:
+        if self._silence:
             return ""
 
-        if not any([self._changed_files, self._unchanged_files, self._failures]):
+        if not (self._changed_files or self._unchanged_files or self._failures):
             typer.secho(
-                ("\n" if self.configs.verbose and self._ignored_paths else "")
+                ("\n" if self._verbose and self._ignored_paths else "")
                 + "No Python files are present to be cleaned. Nothing to do 😴",
                 bold=True,
             )
             raise typer.Exit(0)
 
-        if any([self.configs.check, self.configs.diff]):
-            removed_imports = "would be removed"
-            removed_imports_plural = removed_imports
-            expanded_stars = "would be expanded"
-            expanded_stars_plural = expanded_stars
-            changed_files = "would be changed"
-            changed_files_plural = changed_files
-            unchanged_files = "would be left unchanged"
-            unchanged_files_plural = unchanged_files
-            undecidable_case = "would be skipped"
-            undecidable_case_plural = undecidable_case
-        else:
-            removed_imports = "was removed"
-            removed_imports_plural = "were removed"
-            expanded_stars = "was expanded"
-            expanded_stars_plural = "were expanded"
-            changed_files = "was changed"
-            changed_files_plural = "were changed"
-            unchanged_files = "left unchanged"
-            unchanged_files_plural = "left unchanged"
-            undecidable_case = "was skipped"
-            undecidable_case_plural = "were skipped"
-        failures = "has failed to be cleaned"
-        failures_plural = "have failed to be cleaned"
-
-        report = []
-
-        if self._removed_imports:
-            plural = self._removed_imports > 1
-            report.append(
-                typer.style(
-                    f"{self._removed_imports} import{'s' if plural else ''} "
-                    f"{removed_imports_plural if plural else removed_imports}",
-                    bold=True,
-                )
-            )
-
-        if self._expanded_stars:
-            plural = self._expanded_stars > 1
-            report.append(
-                typer.style(
-                    f"{self._expanded_stars} import{'s' if plural else ''} "
-                    f"{expanded_stars_plural if plural else expanded_stars}",
-                    bold=True,
-                )
-            )
-
-        if self._changed_files:
-            plural = self._changed_files > 1
-            report.append(
-                typer.style(
-                    f"{self._changed_files} file{'s' if plural else ''} "
-                    f"{changed_files_plural if plural else changed_files}",
-                    bold=True,
-                )
-            )
-
-        if self._unchanged_files:
-            plural = self._unchanged_files > 1
-            report.append(
-                typer.style(
-                    f"{self._unchanged_files} file{'s' if plural else ''} "
-                    f"{unchanged_files_plural if plural else unchanged_files}",
-                    bold=False,
-                )
-            )
-
-        if self._failures:
-            plural = self._failures > 1
-            report.append(
-                typer.style(
-                    f"{self._failures} file{'s' if plural else ''} "
-                    f"{failures_plural if plural else failures}",
-                    bold=False,
-                )
-            )
-
-        if self._undecidable_case:
-            plural = self._undecidable_case > 1
-            report.append(
-                typer.style(
-                    f"{self._undecidable_case} undecidable case{'s' if plural else ''} "
-                    f"{undecidable_case_plural if plural else undecidable_case}",
-                    bold=False,
-                )
-            )
-
-        if self.configs.verbose:
-            ignored_imports = "was ignored"
-            ignored_imports_plural = "were ignored"
-            ignored_paths = "was ignored"
-            ignored_paths_plural = "were ignored"
-
-            if self._ignored_imports:
-                plural = self._ignored_imports > 1
-                report.append(
-                    typer.style(
-                        f"{self._ignored_imports} import{'s' if plural else ''} "
-                        f"{ignored_imports_plural if plural else ignored_imports}",
-                        bold=False,
-                    )
-                )
-
-            if self._ignored_paths:
-                plural = self._ignored_paths > 1
-                report.append(
-                    typer.style(
-                        f"{self._ignored_paths} path{'s' if plural else ''} "
-                        f"{ignored_paths_plural if plural else ignored_paths}",
-                        bold=False,
-                    )
-                )
+        verbs = _CHECK_VERBS if self._check or self._diff else _APPLY_VERBS
+
+        counters = [
+            (self._removed_imports, "import", "removed", True),
+            (self._expanded_stars, "import", "expanded", True),
+            (self._changed_files, "file", "changed", True),
+            (self._unchanged_files, "file", "unchanged", False),
+            (self._failures, "file", "failed", False),
+            (self._undecidable_case, "undecidable case", "skipped", False),
+        ]
+        if self._verbose:
+            counters.append((self._ignored_imports, "import", "ignored", False))
+            counters.append((self._ignored_paths, "path", "ignored", False))
+        report = [
+            self._render_count(count, noun, verbs[verb], bold=bold)
+            for count, noun, verb, bold in counters
+            if count
+        ]
 
         if not self._failures:
             if self._undecidable_case:
@@ -529,5 +603,5 @@ class Report:
             s = "were errors" if self._failures > 1 else "was an error"
             done_msg = f"Oh no, there {s}! 💔 ☹️"
 
-        sdone_msg = typer.style(done_msg + "\n", bold=True)
-        return self.report_prefix + sdone_msg + ", ".join(report) + ".\n"
+        sdone_msg = f"{_STYLE_BOLD}{done_msg}\n{_STYLE_RESET}"
+        return "".join([self.report_prefix, sdone_msg, ", ".join(report), ".\n"])
@@ -2,19 +2,33 @@
 import ast
 import os
 import sys
+from bisect import bisect_right
 from dataclasses import dataclass
 from enum import Enum, unique
-from functools import wraps
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Callable, List, Optional, Set, Tuple, TypeVar, Union, cast
+from typing import (
+    Callable,
+    Dict,
+    FrozenSet,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+    Union,
+    cast,
+)
 
-from . import _nodes, iou, pathu
+from . import _nodes, ast_cache, iou, pathu
 from ._exceptions import ReadPermissionError, UnexpandableImportStar, UnparsableFile
 
 # Constants.
 PY38_PLUS = sys.version_info >= (3, 8)
 PY39_PLUS = sys.version_info >= (3, 9)
 __ALL__ = "__all__"
+TYPING = "typing"
+TYPING_MODULES = frozenset({TYPING, "typing_extensions"})
 NAMES_TO_SKIP = frozenset(
     {
         "__name__",
@@ -84,38 +98,30 @@ SUBSCRIPT_TYPE_VARIABLE = frozenset(
         "type",
     }
 )
+#: `parse_file` tree attribute: False if the source has no `:=` at all.
+_NAMED_EXPRS_ATTR = "_pycln_named_exprs"
+#: `visit_Subscript` names (one set lookup per subscript, `typing.X[...]` too).
+_SUBSCRIPT_NAMES = SUBSCRIPT_TYPE_VARIABLE | {TYPING}
 
 # Custom types.
-FunctionT = TypeVar("FunctionT", bound=Callable[..., Any])
 FunctionDefT = TypeVar(
     "FunctionDefT", bound=Union[ast.FunctionDef, ast.AsyncFunctionDef]
 )
 
 
-def recursive(func: FunctionT) -> FunctionT:
-    """decorator to make `ast.NodeVisitor` work recursive.
-
-    :param func: `ast.NodeVisitor.visit_*` function.
-    """
-
-    @wraps(func)
-    def wrapper(self, *args, **kwargs):
-        func(self, *args, **kwargs)
-        self.generic_visit(*args)
-
-    return cast(FunctionT, wrapper)
-
-
 @dataclass
 class ImportStats:
 
     """Import statements statistics."""
 
+    __slots__ = ("import_", "from_")
+
     import_: Set[_nodes.Import]
     from_: Set[_nodes.ImportFrom]
 
     def __iter__(self):
-        return iter([self.import_, self.from_])
+        yield self.import_
+        yield self.from_
 
 
 @dataclass
@@ -123,6 +129,8 @@ class SourceStats:
 
     """Source code (`ast.Name`, `ast.Attribute`) statistics."""
 
+    __slots__ = ("name_", "attr_", "names_to_skip")
+
     #: Included on `__iter__`.
     name_: Set[str]
     attr_: Set[str]
@@ -131,10 +139,133 @@ class SourceStats:
     names_to_skip: Set[str]
 
     def __iter__(self):
-        return iter([self.name_, self.attr_])
+        yield self.name_
+        yield self.attr_
+
+
+#: Comprehensions (their `:=` targets are bound in the enclosing scope).
+COMPREHENSION_TYPES = (ast.ListComp, ast.SetComp, ast.DictComp, ast.GeneratorExp)
+#: Nodes that open a new (non module level) names scope.
+NEW_SCOPE_TYPES = (
+    ast.FunctionDef,
+    ast.AsyncFunctionDef,
+    ast.ClassDef,
+    ast.Lambda,
+) + COMPREHENSION_TYPES
+
+#: Node fields that never hold child nodes (besides `Constant.value`).
+#: `name` is not included as it's a node on `ast.TypeAlias` (3.12+).
+_LEAF_FIELDS = frozenset(
+    {
+        "ctx",
+        "id",
+        "attr",
+        "arg",
+        "asname",
+        "module",
+        "level",
+        "n",
+        "s",
+        "kind",
+        "type_comment",
+        "is_async",
+        "conversion",
+        "simple",
+        "tag",
+    }
+)
+_CONSTANT_TYPES = (ast.Constant,) if PY38_PLUS else (ast.Constant, ast.NameConstant)
+#: Node class to its fields that may hold child nodes (see `get_child_fields`).
+_CHILD_FIELDS: Dict[type, Tuple[str, ...]] = {}
+
+
+def get_child_fields(cls: type) -> Tuple[str, ...]:
+    """Get the fields of the given node class that may hold child nodes.
+
+    Computed once per class, so the walkers don't `getattr` the
+    primitive fields (`Name.id`, `alias.name`, ...) of every node.
+
+    :param cls: an `ast.AST` subclass.
+    :returns: tuple of field names.
+    """
+    try:
+        return _CHILD_FIELDS[cls]
+    except KeyError:
+        is_constant = issubclass(cls, _CONSTANT_TYPES)
+        fields = _CHILD_FIELDS[cls] = tuple(
+            field
+            for field in cls._fields  # type: ignore
+            if field not in _LEAF_FIELDS and not (is_constant and field == "value")
+        )
+        return fields
+
+
+class StopVisiting(Exception):
+
+    """Raises by a `visit_*` handler to end an `IterativeNodeVisitor` walk."""
+
+
+class IterativeNodeVisitor(ast.NodeVisitor):
 
+    """`ast.NodeVisitor` that walks the tree with an explicit stack.
 
-class SourceAnalyzer(ast.NodeVisitor):
+    Nodes are visited in the same (depth-first, pre-order) order as the
+    recursive `ast.NodeVisitor`, calling the matching `visit_*` handler
+    (if any) before deciding whether to descend into the node children.
+    A handler may raise `StopVisiting` to end the walk early.
+    """
+
+    def visit(self, node: ast.AST) -> None:
+        try:
+            self._walk(node)
+        except StopVisiting:
+            pass
+
+    def _walk(self, node: ast.AST) -> None:
+        handlers: Dict[type, Optional[Callable]] = {}
+        child_fields = _CHILD_FIELDS
+        stack = [node]
+        pop, push = stack.pop, stack.extend
+        while stack:
+            node = pop()
+            cls = node.__class__
+            try:
+                handler = handlers[cls]
+            except KeyError:
+                handler = handlers[cls] = getattr(self, "visit_" + cls.__name__, None)
+            if handler is not None:
+                handler(node)
+            try:
+                fields = child_fields[cls]
+            except KeyError:
+                fields = get_child_fields(cls)
+            #: Leaves (`Name`, `Constant`, ...) are most of the nodes,
+            #: don't ask `_descend` about nodes without children.
+            if fields and self._descend(node):
+                children: List[ast.AST] = []
+                for field in fields:
+                    value = getattr(node, field, None)
+                    if isinstance(value, list):
+                        for item in value:
+                            if isinstance(item, ast.AST):
+                                children.append(item)
+                    elif isinstance(value, ast.AST):
+                        children.append(value)
+                children.reverse()
+                push(children)
+
+    def generic_visit(self, node: ast.AST) -> None:
+        """Called if no explicit visitor function exists for a node
+        (override)."""
+        for child in ast.iter_child_nodes(node):
+            self.visit(child)
+
+    def _descend(self, node: ast.AST) -> bool:
+        # Whether to visit the children of the given (already visited) `node`.
+        return True
+
+
+class SourceAnalyzer(IterativeNodeVisitor):
 
     """AST source code analyzer.
 
@@ -157,51 +288,60 @@ class SourceAnalyzer(ast.NodeVisitor):
             # Bad class usage.
             raise ValueError("Please provide source lines for Python < 3.8.")
         self._has_all = False  # True if the source has an `__all__` dunder.
-        self._lines = source_lines
+        #: Source lines are only needed to compute `end_lineno` (Python < 3.8).
+        self._lines = None if PY38_PLUS else source_lines
+        #: The joined `self._lines` and their start offsets (built on first use).
+        self._source: Optional[str] = None
+        self._line_offsets: List[int] = []
         self._import_stats = ImportStats(set(), set())
         self._imports_to_skip: Set[Union[_nodes.Import, _nodes.ImportFrom]] = set()
         self._source_stats = SourceStats(set(), set(), set())
+        #: The last `ast.Attribute` whose whole chain has been handled.
+        self._handled_chain: Optional[ast.Attribute] = None
 
-    @recursive
     def visit_Import(self, node: ast.Import):
         if node not in self._imports_to_skip:
             py38_node = self._get_py38_import_node(node)
             self._import_stats.import_.add(py38_node)
 
-    @recursive
     def visit_ImportFrom(self, node: ast.ImportFrom):
         if node not in self._imports_to_skip:
             py38_node = self._get_py38_import_from_node(node)
             if not str(py38_node.module).startswith("__"):
                 self._import_stats.from_.add(py38_node)
 
-    @recursive
     def visit_Name(self, node: ast.Name):
         self._source_stats.name_.add(node.id)
 
-    @recursive
     def visit_Attribute(self, node: ast.Attribute):
-        self._source_stats.attr_.add(node.attr)
+        #: Handle a whole `a.b.c` chain at once (when it ends with a name),
+        #: rather than visiting each nested `ast.Attribute`/`ast.Name`.
+        attrs = [node.attr]
+        value = node.value
+        while value.__class__ is ast.Attribute:
+            attrs.append(value.attr)  # type: ignore
+            value = value.value  # type: ignore
+        if value.__class__ is ast.Name:
+            self._source_stats.attr_.update(attrs)
+            self.visit_Name(value)  # type: ignore
+            self._handled_chain = node
+        else:
+            self._source_stats.attr_.add(node.attr)
 
-    @recursive
     def visit_MatchAs(self, node: "ast.MatchAs"):  # type: ignore
         #: Support Match statement (PYTHON >= 3.10).
         #: PEP0634: https://www.python.org/dev/peps/pep-0634/
         self._source_stats.name_.add(node.name)
 
-    @recursive
     def visit_Call(self, node: ast.Call):
-        func = node.func
+        func_name = get_typing_name(node.func)
 
         #: Support casting case.
         #: >>> from typing import cast
         #: >>> import xxx, yyy
         #: >>> zzz = cast("xxx", yyy)
         #: Issue: https://github.com/hadialqattan/pycln/issues/26
-        if getattr(func, "id", "") == "cast" or (
-            getattr(func, "attr", "") == "cast"
-            and getattr(func.value, "id", "") == "typing"  # type: ignore
-        ):
+        if func_name == "cast":
             self._parse_string(node.args[0])  # type: ignore
 
         #: Support TypeVar cases (when types passed as str).
@@ -209,22 +349,16 @@ class SourceAnalyzer(ast.NodeVisitor):
         #: >>> import X, Y
         #: >>> XType = TypeVar("XType", "X")
         #: >>> YBoundedType = TypeVar("YBoundedType", bound="Y")
-        if getattr(func, "id", "") == "TypeVar" or (
-            getattr(func, "attr", "") == "TypeVar"
-            and getattr(func.value, "id", "") == "typing"  # type: ignore
-        ):
-            args = getattr(node, "args", [])[1:]  # Skip the TypeVar's name.
-            for arg in args:
-                self._parse_string(arg)
+        elif func_name == "TypeVar":
+            for arg in node.args[1:]:  # Skip the TypeVar's name.
+                self._parse_string(arg)  # type: ignore
 
             # Support bounded types (bound="Type")
-            kwargs = getattr(node, "keywords", [])
-            for kwarg in kwargs:
-                if getattr(kwarg, "arg", "") == "bound":
-                    self._parse_string(getattr(kwarg, "value", None))
+            for kwarg in node.keywords:
+                if kwarg.arg == "bound":
+                    self._parse_string(kwarg.value)  # type: ignore
                     break
 
-    @recursive
     def visit_Subscript(self, node: ast.Subscript) -> None:
         #: Support semi string type assigment
         #:
@@ -233,11 +367,14 @@ class SourceAnalyzer(ast.NodeVisitor):
         #: >>>
         #: >>> bar = List['Import']
         #: >>> foo = Union['Import', 'ImportFrom']
-        v = getattr(node, "value", "")
-        _id = (
-            getattr(v.value, "id", "") if hasattr(v, "value") else getattr(v, "id", "")
-        )
-        if _id in SUBSCRIPT_TYPE_VARIABLE or _id == "typing":
+        v = node.value
+        if isinstance(v, ast.Name):
+            _id = v.id
+        else:
+            #: `typing.List[...]` (or any `x.y[...]`) ~> the outer name.
+            v_value = getattr(v, "value", None)
+            _id = v_value.id if isinstance(v_value, ast.Name) else ""
+        if _id in _SUBSCRIPT_NAMES:
             if PY39_PLUS:
                 s_val = node.slice  # type: ignore
             else:
@@ -250,7 +387,6 @@ class SourceAnalyzer(ast.NodeVisitor):
                 else:
                     self._parse_string(elt)  # type: ignore
 
-    @recursive
     def visit_AnnAssign(self, node: ast.AnnAssign):
         #: Support all
         #:
@@ -267,14 +403,9 @@ class SourceAnalyzer(ast.NodeVisitor):
         #: Support (typing/typing_extensions) TypeAlias
         #:
         #: >>> Foo: TypeAlias = "BarClass"
-        annotation: ast.expr = node.annotation
-        if getattr(annotation, "id", "") == "TypeAlias" or (
-            getattr(annotation, "attr", "") == "TypeAlias"
-            and annotation.value.id in ("typing", "typing_extensions")  # type: ignore
-        ):
+        if get_typing_name(node.annotation, TYPING_MODULES) == "TypeAlias":
             self._parse_string(node.value)  # type: ignore
 
-    @recursive
     def visit_arg(self, node: ast.arg):
         # Support Python ^3.8 type comments.
         self._visit_type_comment(node)
@@ -293,7 +424,6 @@ class SourceAnalyzer(ast.NodeVisitor):
         #:  ...     pass
         self._visit_string_type_annotation(node)
 
-    @recursive
     def visit_FunctionDef(self, node: FunctionDefT):
         # Support Python ^3.8 type comments.
         self._visit_type_comment(node)
@@ -315,7 +445,6 @@ class SourceAnalyzer(ast.NodeVisitor):
     # Support `ast.AsyncFunctionDef`.
     visit_AsyncFunctionDef = visit_FunctionDef
 
-    @recursive
     def visit_ClassDef(self, node: ast.ClassDef):
         #: Support imports used in generics and wrapped in string:
         #:
@@ -338,11 +467,11 @@ class SourceAnalyzer(ast.NodeVisitor):
                 for elt in getattr(s_val, "elts", ()) or (s_val,):
                     self._parse_string(elt)  # type: ignore
 
-    @recursive
     def visit_Assign(self, node: ast.Assign):
         # Support Python ^3.8 type comments.
         self._visit_type_comment(node)
-        id_ = getattr(node.targets[0], "id", None)
+        target = node.targets[0]
+        id_ = target.id if isinstance(target, ast.Name) else None
         # These names will be skipped on import `*` case.
         if id_ in NAMES_TO_SKIP:
             self._source_stats.names_to_skip.add(id_)
@@ -367,9 +496,8 @@ class SourceAnalyzer(ast.NodeVisitor):
                 #: Issue: https://github.com/hadialqattan/pycln/issues/28
                 self._add_concatenated_list_names(node.value)
 
-    @recursive
     def visit_AugAssign(self, node: ast.AugAssign):
-        id_ = getattr(node.target, "id", None)
+        id_ = node.target.id if isinstance(node.target, ast.Name) else None
         # Support `__all__` with `+=` operator case.
         if id_ == __ALL__:
             self._has_all = True
@@ -390,7 +518,6 @@ class SourceAnalyzer(ast.NodeVisitor):
                 #: >>> __all__ += ["x", "y"] + ["z"]
                 self._add_concatenated_list_names(node.value)
 
-    @recursive
     def visit_Expr(self, node: ast.Expr):
         #: Support `__all__` dunder overriding with
         #: `append` and `extend` operations:
@@ -468,12 +595,10 @@ class SourceAnalyzer(ast.NodeVisitor):
     ) -> None:
         try:
             # Parse string names/attrs.
-            if isinstance(node, (ast.Constant, ast.Str)):
-                val = getattr(node, "value", "") or getattr(node, "s", "")
-                if val and isinstance(val, str):
-                    val = val.strip()
-                    tree = parse_ast(val, mode="eval")
-                    self._add_name_attr_const(tree, is_str_annotation)
+            val = get_str_value(node)
+            if val:
+                tree = parse_ast(val.strip(), mode="eval")
+                self._add_name_attr_const(tree, is_str_annotation)
         except UnparsableFile:
             #: Ignore errors when parsing Literals
             #: that are not valid identifiers (e.g. contain white-spaces).
@@ -496,42 +621,69 @@ class SourceAnalyzer(ast.NodeVisitor):
 
     def _add_list_names(self, node: List[ast.expr]) -> None:
         # Safely add list `const/str` names to `self._source_stats.name_`.
-        for item in node:
-            if isinstance(item, (ast.Constant, ast.Str)):
-                key = "s" if hasattr(item, "s") else "value"
-                value = getattr(item, key, "")
-                if value and isinstance(value, str):
-                    self._source_stats.name_.add(value)
+        self._source_stats.name_.update(get_str_elts(node))
 
     def _add_name_attr_const(self, tree: ast.AST, is_str_annotation: bool = False):
         # Add any `ast.Name`, `ast.Attribute`, and (`ast.Constant` if is_str_annotation)
         # child to `self._source_stats`.
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Name):
-                self._source_stats.name_.add(node.id)
-            elif isinstance(node, ast.Attribute):
-                self._source_stats.attr_.add(node.attr)
+        #: A plain stack over the (few) annotation nodes instead of
+        #: `ast.walk`, the order doesn't matter as only sets are filled.
+        name_, attr_ = self._source_stats.name_, self._source_stats.attr_
+        stack = [tree]
+        while stack:
+            node = stack.pop()
+            cls = node.__class__
+            if cls is ast.Name:
+                name_.add(node.id)  # type: ignore
+                continue
+            if cls is ast.Attribute:
+                attr_.add(node.attr)  # type: ignore
             elif is_str_annotation and isinstance(node, ast.Constant):
                 self._parse_string(node, is_str_annotation)
+                continue
+            for field in get_child_fields(cls):
+                value = getattr(node, field, None)
+                if isinstance(value, list):
+                    stack.extend(item for item in value if isinstance(item, ast.AST))
+                elif isinstance(value, ast.AST):
+                    stack.append(value)
 
-    def _get_py38_import_node(self, node: ast.Import) -> _nodes.Import:
-        # Convert any Python < 3.8 `ast.Import`
-        # to `_nodes.Import` in order to support `end_lineno`.
-        if hasattr(node, "end_lineno"):
-            end_lineno = node.end_lineno
-        else:
+    #: The `end_lineno` source is picked once (class creation), not per node.
+    if PY38_PLUS:
+
+        def _get_py38_import_node(self, node: ast.Import) -> _nodes.Import:
+            # Convert `ast.Import` to `_nodes.Import`.
+            location = _nodes.NodeLocation(
+                (node.lineno, node.col_offset), node.end_lineno  # type: ignore
+            )
+            return _nodes.Import(location=location, names=node.names)
+
+        def _get_py38_import_from_node(self, node: ast.ImportFrom) -> _nodes.ImportFrom:
+            # Convert `ast.ImportFrom` to `_nodes.ImportFrom`.
+            location = _nodes.NodeLocation(
+                (node.lineno, node.col_offset), node.end_lineno  # type: ignore
+            )
+            return _nodes.ImportFrom(
+                location=location,
+                names=node.names,
+                module=node.module,
+                level=node.level,
+            )
+
+    else:
+
+        def _get_py38_import_node(self, node: ast.Import) -> _nodes.Import:
+            # Convert any Python < 3.8 `ast.Import`
+            # to `_nodes.Import` in order to support `end_lineno`.
             line = self._lines[node.lineno - 1]
             multiline = SourceAnalyzer._is_parentheses(line) is not None
             end_lineno = node.lineno + (1 if multiline else 0)
-        location = _nodes.NodeLocation((node.lineno, node.col_offset), end_lineno)
-        return _nodes.Import(location=location, names=node.names)
-
-    def _get_py38_import_from_node(self, node: ast.ImportFrom) -> _nodes.ImportFrom:
-        # Convert any Python < 3.8 `ast.ImportFrom`
-        # to `_nodes.ImportFrom` in order to support `end_lineno`.
-        if hasattr(node, "end_lineno"):
-            end_lineno = node.end_lineno
-        else:
+            location = _nodes.NodeLocation((node.lineno, node.col_offset), end_lineno)
+            return _nodes.Import(location=location, names=node.names)
+
+        def _get_py38_import_from_node(self, node: ast.ImportFrom) -> _nodes.ImportFrom:
+            # Convert any Python < 3.8 `ast.ImportFrom`
+            # to `_nodes.ImportFrom` in order to support `end_lineno`.
             line = self._lines[node.lineno - 1]
             is_parentheses = SourceAnalyzer._is_parentheses(line)
             multiline = is_parentheses is not None
@@ -540,13 +692,13 @@ class SourceAnalyzer(ast.NodeVisitor):
                 if not multiline
                 else self._get_end_lineno(node.lineno, is_parentheses)
             )
-        location = _nodes.NodeLocation((node.lineno, node.col_offset), end_lineno)
-        return _nodes.ImportFrom(
-            location=location,
-            names=node.names,
-            module=node.module,
-            level=node.level,
-        )
+            location = _nodes.NodeLocation((node.lineno, node.col_offset), end_lineno)
+            return _nodes.ImportFrom(
+                location=location,
+                names=node.names,
+                module=node.module,
+                level=node.level,
+            )
 
     @staticmethod
     def _is_parentheses(import_from_line: str) -> Optional[bool]:
@@ -561,17 +713,36 @@ class SourceAnalyzer(ast.NodeVisitor):
 
     def _get_end_lineno(self, lineno: int, is_parentheses: bool) -> int:
         # Get `ast.ImportFrom` `end_lineno` of the given `lineno`.
+        #: Search the joined source with `str.find` (a C-level scan)
+        #: instead of testing every following line in Python.
         lines_len = len(self._lines)
-        for end_lineno in range(lineno, lines_len):
-            if is_parentheses:
-                if ")" in self._lines[end_lineno]:
-                    end_lineno += 1
-                    break
-            else:
-                if "\\" not in self._lines[end_lineno]:
-                    end_lineno += 1
-                    break
-        return end_lineno
+        if self._source is None:
+            self._source = "".join(self._lines)
+            offset = 0
+            for line in self._lines:
+                self._line_offsets.append(offset)
+                offset += len(line)
+        source, offsets = self._source, self._line_offsets
+        if lineno >= lines_len:
+            return lineno
+        if is_parentheses:
+            idx = source.find(")", offsets[lineno])
+            #: `bisect_right` returns the (one-based) line number of `idx`.
+            return bisect_right(offsets, idx) if idx != -1 else lines_len - 1
+        #: The first following line without a backslash.
+        while lineno < lines_len:
+            idx = source.find("\\", offsets[lineno])
+            if idx == -1:
+                return lineno + 1
+            idx_lineno = bisect_right(offsets, idx) - 1
+            if idx_lineno > lineno:
+                return lineno + 1
+            lineno = idx_lineno + 1
+        return lines_len - 1
+
+    def _descend(self, node: ast.AST) -> bool:
+        # Skip the already handled attribute chains.
+        return node is not self._handled_chain
 
     def get_stats(self) -> Tuple[SourceStats, ImportStats]:
         """Get source analyzer results.
@@ -588,7 +759,7 @@ class SourceAnalyzer(ast.NodeVisitor):
         return self._has_all
 
 
-class ImportablesAnalyzer(ast.NodeVisitor):
+class ImportablesAnalyzer(IterativeNodeVisitor):
 
     """Get set of all importable names from given `ast.Module`.
 
@@ -601,17 +772,22 @@ class ImportablesAnalyzer(ast.NodeVisitor):
     >>> importable_names = analyzer.get_stats()
 
     :param path: a file path that belongs to the given `ast.Module`.
+    :param named_exprs: False if the source can't contain assignment
+        expressions (`:=`), then the expressions are not visited at all.
     """
 
-    def __init__(self, path: Path):
-        self._not_importables: Set[Union[ast.Name, str]] = set()
-        self._importables: Set[str] = set()
+    def __init__(self, path: Path, named_exprs: bool = True):
+        self._importables: List[str] = []
         self._has_all = False  # True if the source has an `__all__` dunder.
         self._path = path
+        self._named_exprs = named_exprs
 
-    @recursive
     def visit_Assign(self, node: ast.Assign):
-        id_ = getattr(node.targets[0], "id", None)
+        target = node.targets[0]
+        id_ = target.id if isinstance(target, ast.Name) else None
+        if id_ != __ALL__ and not self._has_all:
+            for target in node.targets:
+                self._add_store_names(target)
         # Support `__all__` dunder overriding cases.
         if id_ == __ALL__:
             self._has_all = True
@@ -634,9 +810,9 @@ class ImportablesAnalyzer(ast.NodeVisitor):
                 #: Issue: https://github.com/hadialqattan/pycln/issues/28
                 self._add_concatenated_list_names(node.value)
 
-    @recursive
     def visit_AugAssign(self, node: ast.AugAssign):
-        id_ = getattr(node.target, "id", None)
+        self._add_store_names(node.target)
+        id_ = node.target.id if isinstance(node.target, ast.Name) else None
         # Support `__all__` with `+=` operator case.
         if id_ == __ALL__:
             self._has_all = True
@@ -657,7 +833,6 @@ class ImportablesAnalyzer(ast.NodeVisitor):
                 #: >>> __all__ += ["x", "y"] + ["z"]
                 self._add_concatenated_list_names(node.value)
 
-    @recursive
     def visit_Expr(self, node: ast.Expr):
         #: Support `__all__` dunder overriding with
         #: `append` and `extend` operations:
@@ -684,50 +859,86 @@ class ImportablesAnalyzer(ast.NodeVisitor):
                     if isinstance(arg, ast.List):
                         self._add_list_names(arg.elts)
 
-    @recursive
     def visit_Import(self, node: ast.Import):
         # Analyze each import statement.
         for alias in node.names:
             name = alias.asname if alias.asname else alias.name
-            self._importables.add(name)
+            self._importables.append(name)
 
-    @recursive
     def visit_ImportFrom(self, node: ast.ImportFrom):
         # Analyze each importFrom statement.
         try:
             if node.names[0].name == "*":
-                # Expand import star if possible.
-                node = cast(ast.ImportFrom, expand_import_star(node, self._path))
+                # Expand import star if possible (on a copy, so
+                # the visited tree is left untouched).
+                star_node = ast.copy_location(
+                    ast.ImportFrom(module=node.module, names=[], level=node.level),
+                    node,
+                )
+                node = cast(ast.ImportFrom, expand_import_star(star_node, self._path))
             for alias in node.names:
                 name = alias.asname if alias.asname else alias.name
-                self._importables.add(name)
+                self._importables.append(name)
         except UnexpandableImportStar:  # pragma: no cover
             # * We shouldn't do anything because it's not importable.
             pass  # pragma: no cover
 
-    @recursive
     def visit_FunctionDef(self, node: FunctionDefT):
         # Add function name as importable name.
-        if node.name not in self._not_importables:
-            self._importables.add(node.name)
-        self._compute_not_importables(node)
+        self._importables.append(node.name)
 
     # Support `ast.AsyncFunctionDef`.
     visit_AsyncFunctionDef = visit_FunctionDef
 
-    @recursive
     def visit_ClassDef(self, node: ast.ClassDef):
         # Add class name as importable name.
-        if node.name not in self._not_importables:
-            self._importables.add(node.name)
-        self._compute_not_importables(node)
+        self._importables.append(node.name)
 
-    @recursive
-    def visit_Name(self, node: ast.Name):
-        if isinstance(node.ctx, ast.Store):
-            # Except not-importables.
-            if node not in self._not_importables:
-                self._importables.add(node.id)
+    def visit_AnnAssign(self, node: ast.AnnAssign):
+        if not self._has_all:
+            self._add_store_names(node.target)
+
+    def visit_For(self, node: Union[ast.For, ast.AsyncFor]):
+        if not self._has_all:
+            self._add_store_names(node.target)
+
+    # Support `ast.AsyncFor`.
+    visit_AsyncFor = visit_For
+
+    def visit_With(self, node: Union[ast.With, ast.AsyncWith]):
+        if not self._has_all:
+            for item in node.items:
+                if item.optional_vars is not None:
+                    self._add_store_names(item.optional_vars)
+
+    # Support `ast.AsyncWith`.
+    visit_AsyncWith = visit_With
+
+    def visit_NamedExpr(self, node: "ast.NamedExpr"):  # type: ignore
+        #: Support assignment expressions (PYTHON >= 3.8).
+        if not self._has_all:
+            self._add_store_names(node.target)
+
+    def visit_TypeAlias(self, node: "ast.TypeAlias"):  # type: ignore
+        #: Support type alias statements (PYTHON >= 3.12).
+        if not self._has_all:
+            self._add_store_names(node.name)
+
+    def _add_store_names(self, target: ast.expr) -> None:
+        #: Add the names bound by the given assignment target, instead of
+        #: checking the `ctx` of every (mostly `ast.Load`) `ast.Name`.
+        #:
+        #: >>> x, [y, *z], i.j, k[0] = ...  # x, y, z
+        stack = [target]
+        while stack:
+            node = stack.pop()
+            cls = node.__class__
+            if cls is ast.Name:
+                self._importables.append(node.id)  # type: ignore
+            elif cls is ast.Tuple or cls is ast.List:
+                stack.extend(node.elts)  # type: ignore
+            elif cls is ast.Starred:
+                stack.append(node.value)  # type: ignore
 
     def _add_concatenated_list_names(self, node: ast.BinOp) -> None:
         #: Safely add `["x", "y"] + ["i", "j"]`
@@ -741,43 +952,32 @@ class ImportablesAnalyzer(ast.NodeVisitor):
 
     def _add_list_names(self, node: List[ast.expr]) -> None:
         # Safely add list `const/str` names to `self._importables`.
-        for item in node:
-            if isinstance(item, (ast.Constant, ast.Str)):
-                key = "s" if hasattr(item, "s") else "value"
-                value = getattr(item, key, "")
-                if value and isinstance(value, str):
-                    self._importables.add(value)
-
-    def _compute_not_importables(self, node: Union[FunctionDefT, ast.ClassDef]):
-        # Compute class/function not-importables.
-        for node_ in ast.iter_child_nodes(node):
-            if isinstance(node_, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
-                self._not_importables.add(cast(str, node_.name))
-
-            if isinstance(node_, ast.Assign):
-                for target in node_.targets:
-                    self._not_importables.add(cast(ast.Name, target))
+        self._importables.extend(get_str_elts(node))
 
     def get_stats(self) -> Set[str]:
+        # Names are collected (with duplicates) in a list and deduplicated once.
+        importables = set(self._importables)
         if self._path.name == "__init__.py":
             for path in os.listdir(self._path.parent):
                 file_path = self._path.parent.joinpath(path)
                 if file_path.is_dir() or path.endswith(".py"):
-                    self._importables.add(path.split(".")[0])
-        return self._importables
+                    importables.add(path.split(".")[0])
+        return importables
 
-    def generic_visit(self, node):
-        """Called if no explicit visitor function exists for a node
-        (override)."""
+    def _descend(self, node: ast.AST) -> bool:
         # Continue visiting if only if `__all__` has not overridden.
-        if (not self._has_all) or isinstance(node, ast.AugAssign):
-            for _, value in ast.iter_fields(node):
-                if isinstance(value, list):
-                    for item in value:
-                        if isinstance(item, ast.AST):
-                            self.visit(item)
-                elif isinstance(value, ast.AST):
-                    self.visit(value)
+        if self._has_all:
+            return isinstance(node, ast.AugAssign)
+        #: Only the module scope names are importable, skip the
+        #: function/class/lambda bodies altogether. A comprehension is
+        #: only visited for its assignment expressions:
+        #:
+        #: >>> [y := f(x) for x in data]  # `y` is a module level name.
+        if isinstance(node, NEW_SCOPE_TYPES):
+            return self._named_exprs and isinstance(node, COMPREHENSION_TYPES)
+        #: Stored names are read from the statement targets, so an
+        #: expression subtree can only bind an assignment expression target.
+        return self._named_exprs or not isinstance(node, ast.expr)
 
 
 @unique
@@ -796,7 +996,17 @@ class HasSideEffects(Enum):
     NOT_KNOWN = -2
 
 
-class SideEffectsAnalyzer(ast.NodeVisitor):
+#: `SideEffectsAnalyzer` internal state is an ordered level (so it can only
+#: be raised), these map it from/to the public `HasSideEffects` values.
+_SIDE_EFFECTS_LEVEL = {
+    HasSideEffects.NO: 0,
+    HasSideEffects.MAYBE: 1,
+    HasSideEffects.YES: 2,
+}
+_LEVEL_SIDE_EFFECTS = (HasSideEffects.NO, HasSideEffects.MAYBE, HasSideEffects.YES)
+
+
+class SideEffectsAnalyzer(IterativeNodeVisitor):
 
     """Check if the given `ast.Module` has side effects or not.
 
@@ -811,9 +1021,10 @@ class SideEffectsAnalyzer(ast.NodeVisitor):
 
     def __init__(self):
         self._not_side_effects: Set[ast.Call] = set()
-        self._has_side_effects = HasSideEffects.NO
+        self._level = 0  # `HasSideEffects.NO`.
+        self._stdlib_names = pathu.get_standard_lib_names()
+        self._imports_with_side_effects = pathu.IMPORTS_WITH_SIDE_EFFECTS
 
-    @recursive
     def visit_FunctionDef(self, node: FunctionDefT):
         # Mark any call inside a function as not-side-effect.
         self._compute_not_side_effects(node)
@@ -821,7 +1032,6 @@ class SideEffectsAnalyzer(ast.NodeVisitor):
     # Support `ast.AsyncFunctionDef`.
     visit_AsyncFunctionDef = visit_FunctionDef
 
-    @recursive
     def visit_ClassDef(self, node: ast.ClassDef):
         # Mark any call inside a class as not-side-effect.
         self._compute_not_side_effects(node)
@@ -830,39 +1040,46 @@ class SideEffectsAnalyzer(ast.NodeVisitor):
         self, node: Union[ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef]
     ) -> None:
         # Mark any call inside the given `node` as not-side-effect.
-        for node_ in ast.iter_child_nodes(node):
+        for node_ in node.body:
             if isinstance(node_, ast.Expr):
                 if isinstance(node_.value, ast.Call):
                     self._not_side_effects.add(node_.value)
 
-    @recursive
     def visit_Call(self, node: ast.Call):
         if node not in self._not_side_effects:
-            self._has_side_effects = HasSideEffects.YES
+            self._set_has_side_effects(HasSideEffects.YES)
 
-    @recursive
     def visit_Import(self, node: ast.Import):
-        self._has_side_effects = SideEffectsAnalyzer._check_names(node.names)
+        self._set_has_side_effects(self._check_names(node.names))
 
-    @recursive
     def visit_ImportFrom(self, node: ast.ImportFrom):
         packages = node.module.split(".") if node.module else []
         packages_aliases = [ast.alias(name=name, asname=None) for name in packages]
-        self._has_side_effects = SideEffectsAnalyzer._check_names(packages_aliases)
-        if self._has_side_effects is HasSideEffects.NO:
-            self._has_side_effects = SideEffectsAnalyzer._check_names(node.names)
-
-    @staticmethod
-    def _check_names(names: List[ast.alias]) -> HasSideEffects:
+        self._set_has_side_effects(self._check_names(packages_aliases))
+        if not self._level:
+            self._set_has_side_effects(self._check_names(node.names))
+
+    def _set_has_side_effects(self, has_side_effects: HasSideEffects) -> None:
+        # The level never goes down (a later `import os` can't clear a
+        # previous MAYBE), and a known side effect is final, so there's
+        # no need to visit the rest of the tree.
+        level = _SIDE_EFFECTS_LEVEL[has_side_effects]
+        if level > self._level:
+            self._level = level
+            if level == 2:
+                raise StopVisiting()
+
+    def _check_names(self, names: List[ast.alias]) -> HasSideEffects:
         # Check if imported names has side effects or not.
+        stdlib_names = self._stdlib_names
         for alias in names:
             # All standard lib modules doesn't has side effects
             # except `pathu.IMPORTS_WITH_SIDE_EFFECTS`.
-            if alias.name in pathu.get_standard_lib_names():
+            if alias.name in stdlib_names:
                 continue
 
             # Known side effects.
-            if alias.name in pathu.IMPORTS_WITH_SIDE_EFFECTS:
+            if alias.name in self._imports_with_side_effects:
                 return HasSideEffects.YES
 
             # [Here instead of doing that, we can make the analyzer
@@ -874,20 +1091,84 @@ class SideEffectsAnalyzer(ast.NodeVisitor):
         return HasSideEffects.NO
 
     def has_side_effects(self) -> HasSideEffects:
-        return self._has_side_effects
+        return _LEVEL_SIDE_EFFECTS[self._level]
 
-    def generic_visit(self, node):
-        """Called if no explicit visitor function exists for a node
-        (override)."""
-        # Continue visiting if only if there's no know side effects.
-        if self._has_side_effects is HasSideEffects.NO:
-            for _, value in ast.iter_fields(node):
-                if isinstance(value, list):
-                    for item in value:
-                        if isinstance(item, ast.AST):
-                            self.visit(item)
-                elif isinstance(value, ast.AST):
-                    self.visit(value)
+
+def get_typing_name(
+    node: ast.expr, modules: FrozenSet[str] = frozenset({TYPING})
+) -> str:
+    """Get the name of a (maybe `typing.` qualified) name reference.
+
+    >>> get_typing_name(ast.parse("cast", mode="eval").body)
+    'cast'
+    >>> get_typing_name(ast.parse("typing.cast", mode="eval").body)
+    'cast'
+
+    :param node: an expression (e.g. `ast.Call.func`).
+    :param modules: accepted qualifying module names.
+    :returns: `Name.id`, or `Attribute.attr` when qualified by one of
+        `modules`, else an empty string.
+    """
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute):
+        value = node.value
+        if isinstance(value, ast.Name) and value.id in modules:
+            return node.attr
+    return ""
+
+
+#: The string literal node type is picked once (import time), not per node:
+#: `ast.Str` is a slow `isinstance` shim (deprecated) on 3.8+.
+if PY38_PLUS:
+
+    def get_str_value(node: Optional[ast.AST]) -> str:
+        """Get the value of the given string literal node.
+
+        :param node: any node.
+        :returns: the string value, or an empty string for non-string nodes.
+        """
+        if isinstance(node, ast.Constant) and isinstance(node.value, str):
+            return node.value
+        return ""
+
+    def get_str_elts(elts: List[ast.expr]) -> List[str]:
+        """Get the non-empty string literals of the given `elts`.
+
+        Non-string items are skipped (unlike `ast.literal_eval`, which gives
+        up on the whole list).
+
+        :param elts: `ast.List/Tuple/Set` elements (or call args).
+        :returns: list of string values.
+        """
+        return [
+            item.value
+            for item in elts
+            if isinstance(item, ast.Constant)
+            and isinstance(item.value, str)
+            and item.value
+        ]
+
+else:
+
+    def get_str_value(node: Optional[ast.AST]) -> str:
+        """Get the value of the given string literal node.
+
+        :param node: any node.
+        :returns: the string value, or an empty string for non-string nodes.
+        """
+        return node.s if isinstance(node, ast.Str) else ""
+
+    def get_str_elts(elts: List[ast.expr]) -> List[str]:
+        """Get the non-empty string literals of the given `elts`.
+
+        Non-string items are skipped (unlike `ast.literal_eval`, which gives
+        up on the whole list).
+
+        :param elts: `ast.List/Tuple/Set` elements (or call args).
+        :returns: list of string values.
+        """
+        return [item.s for item in elts if isinstance(item, ast.Str) and item.s]
 
 
 def expand_import_star(
@@ -899,20 +1180,16 @@ def expand_import_star(
     :param path: where the node has imported.
     :returns: expanded `_nodes/ast.ImportFrom` (same input node type).
     :raises UnexpandableImportStar: when `ReadPermissionError`,
-        `UnparsableFile` or `ModuleNotFoundError` or `RecursionError` raised.
+        `UnparsableFile` or `ModuleNotFoundError` or `RecursionError`
+        or `OSError` raised.
     """
     mpath = pathu.get_import_from_path(path, "*", node.module, node.level)
 
-    importables: Set[str] = set()
+    importables: FrozenSet[str] = frozenset()
 
     try:
         if mpath:
-            content, _, _ = iou.safe_read(mpath, permissions=(os.R_OK,))
-            tree = parse_ast(content, mpath)
-
-            analyzer = ImportablesAnalyzer(mpath)
-            analyzer.visit(tree)
-            importables = analyzer.get_stats()
+            importables = get_importables(mpath, get_file_stamp(mpath))
         else:
             name = ("." * node.level) + (node.module if node.module else "")
             raise ModuleNotFoundError(name=name)
@@ -921,6 +1198,7 @@ def expand_import_star(
         UnparsableFile,
         ModuleNotFoundError,
         RecursionError,
+        OSError,
     ) as err:
         if isinstance(err, ModuleNotFoundError):
             msg = f"{err.name!r} module not found or it's a C wrapped module!"
@@ -929,12 +1207,10 @@ def expand_import_star(
         else:
             msg = str(err)  # pragma: nocover
 
-        if hasattr(node, "location"):
-            location = node.location  # type: ignore # pragma: nocover.
+        if isinstance(node, _nodes.ImportFrom):
+            location = node.location  # pragma: nocover.
         else:
-            location = _nodes.NodeLocation(
-                (node.lineno, node.col_offset), 0  # type: ignore
-            )
+            location = _nodes.NodeLocation((node.lineno, node.col_offset), 0)
 
         raise UnexpandableImportStar(path, location, msg) from err
 
@@ -946,7 +1222,71 @@ def expand_import_star(
     return node
 
 
-def parse_ast(source_code: str, path: Path = Path(""), mode: str = "exec") -> ast.AST:
+@lru_cache(maxsize=512)
+def get_importables(path: Path, stamp: Tuple[int, int]) -> FrozenSet[str]:
+    """Get the given module `path` importable names (memoized).
+
+    :param path: `.py` file path.
+    :param stamp: `path` stamp computed by `get_file_stamp`.
+    :returns: frozenset of the importable names (`ImportablesAnalyzer`).
+    :raises ReadPermissionError: when the source does not have read permission.
+    :raises InitFileDoesNotExistError: when `path` is a path to a non-existing
+        `__init__.py` file.
+    :raises UnparsableFile: if the compiled source is invalid,
+        or the source contains null bytes.
+    :raises OSError: if the source can't be read for any other reason.
+    """
+    tree = parse_file(path)
+    analyzer = ImportablesAnalyzer(path, getattr(tree, _NAMED_EXPRS_ATTR, True))
+    analyzer.visit(tree)
+    return frozenset(analyzer.get_stats())
+
+
+def parse_file(path: Path) -> ast.AST:
+    """Read and parse the given `path` AST.
+
+    :param path: `.py` file path.
+    :returns: `ast.AST` (source code AST).
+    :raises ReadPermissionError: when the source does not have read permission.
+    :raises InitFileDoesNotExistError: when `path` is a path to a non-existing
+        `__init__.py` file.
+    :raises UnparsableFile: if the compiled source is invalid,
+        or the source contains null bytes.
+    :raises OSError: if the source can't be read for any other reason.
+    """
+    source_code = iou.safe_read_bytes(path)
+    tree = parse_ast(source_code, path)
+    #: A cheap bytes scan (kept next to the tree) that spares
+    #: `ImportablesAnalyzer` walking every expression; a `:=` inside
+    #: a string or a comment just keeps them visited.
+    setattr(tree, _NAMED_EXPRS_ATTR, PY38_PLUS and b":=" in source_code)
+    return tree
+
+
+def get_file_stamp(path: Path) -> Tuple[int, int]:
+    """Get the given `path` modification time and size (`get_importables` cache key).
+
+    The size catches edits within the filesystem timestamp granularity.
+
+    :param path: a file path.
+    :returns: `(st_mtime_ns, st_size)` or `(-1, -1)` if `path` can't be
+        stat'ed (`iou.safe_read_bytes` will report the actual error).
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return -1, -1
+    return st.st_mtime_ns, st.st_size
+
+
+#: Include type_comments when Python >=3.8.
+#: For more information https://www.python.org/dev/peps/pep-0526/ .
+_PARSE_KWARGS = {"type_comments": True} if PY38_PLUS else {}
+
+
+def parse_ast(
+    source_code: Union[str, bytes], path: Path = Path(""), mode: str = "exec"
+) -> ast.AST:
     """Parse the given `source_code` AST.
 
     :param source_code: python source code.
@@ -956,13 +1296,18 @@ def parse_ast(source_code: str, path: Path = Path(""), mode: str = "exec") -> as
     :raises UnparsableFile: if the compiled source is invalid,
         or the source contains null bytes.
     """
+    #: Only whole modules go through the on-disk cache (`PYCLN_AST_CACHE=1`),
+    #: type comments and string annotations are too small to be worth it.
+    key = None
+    if mode == "exec" and ast_cache.is_enabled():
+        key = ast_cache.get_key(source_code)
+        cached_tree = ast_cache.load(key)
+        if cached_tree is not None:
+            return cached_tree
     try:
-        if PY38_PLUS:
-            # Include type_comments when Python >=3.8.
-            # For more information https://www.python.org/dev/peps/pep-0526/ .
-            tree = ast.parse(source_code, mode=mode, type_comments=True)
-        else:
-            tree = ast.parse(source_code, mode=mode)
+        tree = ast.parse(source_code, mode=mode, **_PARSE_KWARGS)
+        if key is not None:
+            ast_cache.store(key, tree)
         return tree
     except (SyntaxError, IndentationError, ValueError) as err:
         raise UnparsableFile(path, err) from err
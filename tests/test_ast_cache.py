@@ -0,0 +1,153 @@
+"""pycln/utils/ast_cache.py tests."""
+# pylint: disable=R0201,W0613
+import ast
+import os
+import sys
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+from pycln.utils import ast_cache, scan
+
+# Constants.
+MOCK = "pycln.utils.ast_cache.%s"
+#: The (unpatched) cache directory getter, see the `cache_dir` fixture.
+GET_CACHE_DIR = ast_cache.get_cache_dir
+
+
+class TestASTCache:
+
+    """`ast_cache.py` functions test case."""
+
+    @pytest.fixture(autouse=True)
+    def cache_dir(self, tmp_path):
+        with mock.patch(MOCK % "get_cache_dir", return_value=tmp_path):
+            yield tmp_path
+
+    @pytest.mark.parametrize(
+        "value, expec",
+        [
+            pytest.param("1", True, id="enabled"),
+            pytest.param("0", False, id="disabled"),
+            pytest.param("", False, id="empty"),
+        ],
+    )
+    def test_is_enabled(self, monkeypatch, value, expec):
+        monkeypatch.setenv(ast_cache.AST_CACHE_ENV, value)
+        assert ast_cache.is_enabled() is expec
+
+    @pytest.mark.parametrize(
+        "xdg_cache_home, expec_root",
+        [
+            pytest.param("/xdg", Path("/xdg"), id="XDG_CACHE_HOME"),
+            pytest.param("", Path("/home/x/.cache"), id="home"),
+        ],
+    )
+    def test_get_cache_dir(self, monkeypatch, xdg_cache_home, expec_root):
+        monkeypatch.setenv("XDG_CACHE_HOME", xdg_cache_home)
+        with mock.patch("pathlib.Path.home", return_value=Path("/home/x")):
+            cache_dir = GET_CACHE_DIR()
+        assert cache_dir == expec_root.joinpath("pycln", "ast")
+
+    def test_get_key(self):
+        key = ast_cache.get_key("import os\n")
+        assert key == ast_cache.get_key(b"import os\n")
+        assert key != ast_cache.get_key("import sys\n")
+        assert len(key) == 64
+
+    def test_store_load(self, cache_dir):
+        key = ast_cache.get_key("import os\n")
+        assert ast_cache.load(key) is None
+        ast_cache.store(key, ast.parse("import os\n"))
+        assert cache_dir.joinpath(key[:2], key + ast_cache.PKL).is_file()
+        tree = ast_cache.load(key)
+        assert ast.dump(tree) == ast.dump(ast.parse("import os\n"))
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="POSIX permissions only.")
+    def test_store_private_cache_dir(self, cache_dir):
+        cache_dir = cache_dir.joinpath("new")
+        with mock.patch(MOCK % "get_cache_dir", return_value=cache_dir):
+            ast_cache.store(ast_cache.get_key("x\n"), ast.parse("x\n"))
+            assert cache_dir.stat().st_mode & 0o777 == 0o700
+            assert ast_cache.is_trusted(cache_dir)
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="POSIX permissions only.")
+    @pytest.mark.parametrize(
+        "mode, uid_offset, expec_trusted",
+        [
+            pytest.param(0o700, 0, True, id="private"),
+            pytest.param(0o755, 0, True, id="read only for others"),
+            pytest.param(0o770, 0, False, id="group writable"),
+            pytest.param(0o703, 0, False, id="world writable"),
+            pytest.param(0o700, 1, False, id="another owner"),
+        ],
+    )
+    def test_is_trusted(self, cache_dir, mode, uid_offset, expec_trusted):
+        cache_dir.chmod(mode)
+        uid = os.getuid() + uid_offset
+        with mock.patch("os.getuid", return_value=uid):
+            assert ast_cache.is_trusted(cache_dir) is expec_trusted
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="POSIX permissions only.")
+    def test_load_untrusted(self, cache_dir):
+        key = ast_cache.get_key("import os\n")
+        ast_cache.store(key, ast.parse("import os\n"))
+        cache_dir.chmod(0o777)
+        with mock.patch("pickle.load") as load:
+            assert ast_cache.load(key) is None
+            assert not load.called
+
+    def test_load_corrupted(self, cache_dir):
+        key = ast_cache.get_key("import os\n")
+        cache_dir.joinpath(key[:2]).mkdir()
+        cache_dir.joinpath(key[:2], key + ast_cache.PKL).write_bytes(b"\x80bad")
+        assert ast_cache.load(key) is None
+
+    @pytest.mark.parametrize(
+        "err",
+        [
+            pytest.param(ImportError, id="ImportError"),
+            pytest.param(TypeError, id="TypeError"),
+            pytest.param(RecursionError, id="RecursionError"),
+        ],
+    )
+    def test_load_any_error(self, cache_dir, err):
+        key = ast_cache.get_key("import os\n")
+        ast_cache.store(key, ast.parse("import os\n"))
+        with mock.patch("pickle.load", side_effect=err):
+            assert ast_cache.load(key) is None
+
+    def test_no_home_directory(self, monkeypatch):
+        monkeypatch.setenv(ast_cache.AST_CACHE_ENV, "1")
+        with mock.patch(MOCK % "get_cache_dir", side_effect=RuntimeError):
+            assert ast.dump(scan.parse_ast("import os\n")) == ast.dump(
+                ast.parse("import os\n")
+            )
+
+    @mock.patch(MOCK % "store")
+    @mock.patch(MOCK % "load")
+    def test_parse_ast_disabled(self, load, store, monkeypatch):
+        monkeypatch.delenv(ast_cache.AST_CACHE_ENV, raising=False)
+        scan.parse_ast("import os\n")
+        assert not load.called
+        assert not store.called
+
+    @pytest.mark.parametrize(
+        "mode, expec_cached",
+        [
+            pytest.param("exec", True, id="module"),
+            pytest.param("eval", False, id="type annotation"),
+        ],
+    )
+    def test_parse_ast_enabled(self, monkeypatch, mode, expec_cached):
+        monkeypatch.setenv(ast_cache.AST_CACHE_ENV, "1")
+        tree = scan.parse_ast("List[str]", mode=mode)
+        key = ast_cache.get_key("List[str]")
+        assert (ast_cache.load(key) is not None) is expec_cached
+        if expec_cached:
+            with mock.patch("ast.parse") as parse:
+                assert ast.dump(scan.parse_ast("List[str]", mode=mode)) == ast.dump(
+                    tree
+                )
+                assert not parse.called
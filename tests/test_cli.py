@@ -1,5 +1,7 @@
 """pycln/utils/cli.py tests."""
 # pylint: disable=R0201,W0613
+from unittest import mock
+
 import pytest
 from typer.testing import CliRunner
 
@@ -66,3 +68,26 @@ class TestCli:
         content = "import x, y\nx\n"
         args = (str(iou.STDIN_NOTATION), "--all")
         self._assert_code_in("1 import was removed", *args, stdin=content)
+
+    @pytest.mark.parametrize("check", [False, True])
+    def test_integrations_jobs(self, tmp_path, check):
+        content = "import x, y\nx\n"
+        paths = [tmp_path.joinpath(f"file{i}.py") for i in range(3)]
+        for path in paths:
+            path.write_text(content)
+        args = [str(tmp_path), "--all", "--jobs", "2"] + (["--check"] if check else [])
+        results = self.cli.invoke(cli.app, args)
+        verb = "would be removed" if check else "were removed"
+        assert f"3 imports {verb}" in results.stdout
+        assert results.exit_code == int(check)
+        for path in paths:
+            assert path.read_text() == (content if check else "import x\nx\n")
+
+    @mock.patch("pycln.utils.refactor.parallel_sessions")
+    def test_jobs_one_pool(self, parallel_sessions, tmp_path):
+        paths = [tmp_path.joinpath(f"file{i}.py") for i in range(2)]
+        for path in paths:
+            path.write_text("import x\n")
+        self.cli.invoke(cli.app, [str(p) for p in paths] + ["--jobs", "2"])
+        parallel_sessions.assert_called_once()
+        assert parallel_sessions.call_args[0][1] == paths
@@ -43,6 +43,7 @@ CONFIG_ATTR = frozenset(
         "expand_stars",
         "no_gitignore",
         "disable_all_dunder_policy",
+        "jobs",
     }
 )
 DEFAULTS = {
@@ -61,6 +62,7 @@ DEFAULTS = {
     "expand_stars": True,
     "no_gitignore": False,
     "disable_all_dunder_policy": False,
+    "jobs": 1,
 }
 
 
@@ -178,6 +180,31 @@ class TestConfig:
                 config.Config(paths=DEFAULTS["paths"], skip_imports=skip_imports)
                 raise sysu.Pass
 
+    @pytest.mark.parametrize(
+        "jobs, expec_jobs, expec_err",
+        [
+            pytest.param(4, 4, sysu.Pass, id="int"),
+            pytest.param("4", 4, sysu.Pass, id="str (config file)"),
+            pytest.param(0, 8, sysu.Pass, id="zero ~> cpu count"),
+            pytest.param(-1, None, Exit, id="negative"),
+            pytest.param("x", None, Exit, id="not a number"),
+        ],
+    )
+    @mock.patch(MOCK % "os.cpu_count")
+    @mock.patch(MOCK % "Config._check_path")
+    @mock.patch(MOCK % "Config._check_regex")
+    def test_check_jobs(self, cr, cp, cpu_count, jobs, expec_jobs, expec_err):
+        cpu_count.return_value = 8
+        with sysu.std_redirect(sysu.STD.ERR):
+            with pytest.raises(expec_err):
+                configs = config.Config(
+                    paths=DEFAULTS["paths"],
+                    skip_imports=DEFAULTS["skip_imports"],
+                    jobs=jobs,
+                )
+                assert configs.jobs == expec_jobs
+                raise sysu.Pass
+
 
 class TestParseConfigFile:
 
@@ -187,6 +187,68 @@ class TestIOU:
                 assert newline == expec_newline
             raise sysu.Pass()
 
+    @pytest.mark.parametrize(
+        "file_path, content, expec_err, chmod",
+        [
+            pytest.param(
+                None,  # None means using the generated temp file path.
+                "print('Hello')\r\n\x0c",
+                sysu.Pass,
+                0o0644,
+                id="best case",
+            ),
+            pytest.param(
+                "DoesNotExistInit/__init__.py",
+                None,
+                InitFileDoesNotExistError,
+                0o0644,
+                id="Init file does not exist",
+            ),
+            pytest.param(
+                "DoesNotExist.py",
+                None,
+                FileNotFoundError,
+                0o0644,
+                id="file does not exist",
+            ),
+            pytest.param(
+                ".",
+                None,
+                IsADirectoryError,
+                0o0644,
+                id="directory",
+                marks=pytest.mark.skipif(
+                    ISWIN, reason="Windows raises PermissionError instead."
+                ),
+            ),
+            pytest.param(
+                None,
+                "code...",
+                ReadPermissionError,
+                0o000,
+                id="no read permission",
+                marks=pytest.mark.skipif(
+                    ISWIN, reason="os.access doesn't support Windows."
+                ),
+            ),
+        ],
+    )
+    def test_safe_read_bytes(self, file_path: str, content: str, expec_err, chmod: int):
+        with pytest.raises(expec_err):
+            if file_path:
+                iou.safe_read_bytes(Path(file_path))
+            with sysu.reopenable_temp_file(content) as tmp_path:
+                set_mode(str(tmp_path), chmod)
+                expec_content = tmp_path.read_bytes()
+                assert iou.safe_read_bytes(tmp_path) == expec_content
+            raise sysu.Pass()
+
+    @mock.patch("builtins.open")
+    def test_safe_read_bytes_permission_error(self, open_):
+        open_.side_effect = PermissionError(13, "Permission denied")
+        with pytest.raises(ReadPermissionError):
+            iou.safe_read_bytes(Path("file.py"))
+
     @pytest.mark.parametrize(
         "fixed_lines, expec_code, expec_newline, expec_err, chmod",
         [
@@ -9,7 +9,7 @@ import pytest
 from pathspec import PathSpec
 
 from pycln import ISWIN
-from pycln.utils import pathu, regexu
+from pycln.utils import config, pathu, regexu
 from pycln.utils.report import Report
 
 from . import DATA_DIR
@@ -41,6 +41,10 @@ class TestPathu:
 
     """`pathu.py` functions test case."""
 
+    def setup_method(self, method):
+        configs = config.Config(paths=[Path("")], skip_imports=set({}))
+        self.reporter = Report(configs)
+
     @pytest.fixture(autouse=True)
     def clear_all_lru_cache(self):
         for func_name in LRU_CACHED_FUNCS:
@@ -134,7 +138,7 @@ class TestPathu:
         self, ignored_path, path, include, exclude, extend_exclude, gitignore, expec
     ):
         sources = pathu.yield_sources(
-            path, include, exclude, extend_exclude, gitignore, Report(None)
+            path, include, exclude, extend_exclude, gitignore, self.reporter
         )
         sources = list(sources)
         if sources and expec:
@@ -151,7 +155,7 @@ class TestPathu:
         extend_exclude = regexu.safe_compile(regexu.EMPTY_REGEX, regexu.EXCLUDE)
         gitignore = regexu.get_gitignore(path)
         sources = pathu.yield_sources(
-            path, include, exclude, extend_exclude, gitignore, Report(None)
+            path, include, exclude, extend_exclude, gitignore, self.reporter
         )
         expected = [
             Path(path / "x.py"),
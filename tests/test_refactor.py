@@ -403,6 +403,7 @@ class TestRefactor:
         remove_useless_passes.return_value = fixed_lines
         for mode in modes:
             setattr(self.configs, mode, True)
+        self.session_maker.reporter = report.Report(self.configs)
         with sysu.std_redirect(sysu.STD.OUT) as stdout:
             self.session_maker._output(fixed_lines, original_lines, "utf-8", "\n")
             assert expec_output, "Expected output mustn't be empty str."
@@ -435,6 +436,7 @@ class TestRefactor:
     ):
         remove_useless_passes.return_value = fixed_lines
         setattr(self.configs, "silence", True)
+        self.session_maker.reporter = report.Report(self.configs)
         with sysu.std_redirect(sysu.STD.OUT) as stdout:
             self.session_maker._path = iou.STDIN_FILE
             self.session_maker._output(fixed_lines, original_lines, "utf-8", "\n")
@@ -1104,6 +1106,16 @@ class TestRefactor:
                 None,
                 id="no read permission",
             ),
+            pytest.param(
+                Path(""),
+                ("", "", ""),
+                FileNotFoundError(2, "No such file or directory"),
+                None,
+                None,
+                HasSideEffects.NOT_KNOWN,
+                None,
+                id="file not found",
+            ),
             pytest.param(
                 Path(""),
                 ("", "", ""),
@@ -1140,7 +1152,7 @@ class TestRefactor:
     @mock.patch(MOCK % "scan.SideEffectsAnalyzer.__init__")
     @mock.patch(MOCK % "scan.SideEffectsAnalyzer.visit")
     @mock.patch(MOCK % "scan.parse_ast")
-    @mock.patch(MOCK % "iou.safe_read")
+    @mock.patch(MOCK % "iou.safe_read_bytes")
     @mock.patch(MOCK % "pathu.get_import_path")
     @mock.patch(MOCK % "pathu.get_import_from_path")
     def test_has_side_effects(
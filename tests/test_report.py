@@ -1,9 +1,12 @@
 """pycln/utils/report.py tests."""
 # pylint: disable=R0201,W0613
 import ast
+import difflib
+import re
 from contextlib import contextmanager
 from pathlib import Path
 from typing import Generator
+from unittest import mock
 
 import pytest
 from typer import Exit
@@ -25,27 +28,91 @@ class TestReport:
         self.alias = ast.alias(name="x", asname=None)
         self.impt = ImportFrom(NodeLocation((1, 0), 1), [self.alias], "xx", 1)
 
+    def set_modes(self, *modes: str) -> None:
+        # The reporter reads the config flags once on creation.
+        for mode in modes:
+            setattr(self.configs, mode, True)
+        self.reporter = report.Report(self.configs)
+
     def test_get_location(self):
         path, location = Path("file_path"), NodeLocation((2, 0), 4)
         str_location = report.Report.get_location(path, location)
         assert str_location == "file_path:2:0"
 
-    @pytest.mark.parametrize(
-        "type_", ["isedit", "issuccess", "iswarning", "iserror", ""]
-    )
+    @pytest.mark.parametrize("type_", ["edit", "success", "warning", "error", ""])
     def test_secho(self, type_):
         err = sysu.Pass if type_ else ValueError
         with pytest.raises(err):
-            if type_ in {"iswarning", "iserror"}:
+            if type_ in {"warning", "error"}:
                 std = sysu.STD.ERR
             else:
                 std = sysu.STD.OUT
             with sysu.std_redirect(std) as stream:
-                kwargs = {type_: True} if type_ else {}
-                report.Report.secho("msg", bold=False, **kwargs)
+                self.reporter.secho("msg", bold=False, kind=type_)
+                self.reporter.flush()
                 assert "msg" in stream.getvalue()
             raise sysu.Pass()
 
+    @pytest.mark.parametrize("is_tty", [True, False])
+    def test_secho_styling(self, is_tty):
+        self.reporter._out_tty = is_tty
+        with mock.patch.object(report.Report, "flush") as flush:
+            self.reporter.secho("msg", bold=True, kind="edit")
+            assert flush.called is is_tty
+        (message,) = self.reporter._out_buf
+        assert ("\x1b[" in message) is is_tty
+        assert re.sub(r"\x1b\[\d+m", "", message) == "  msg\n"
+
+    def test_secho_flush_threshold(self):
+        with sysu.std_redirect(sysu.STD.OUT) as stdout:
+            self.reporter.secho("msg", bold=False, kind="edit")
+            assert stdout.getvalue() == ""
+            self.reporter.secho("x" * report._FLUSH_THRESHOLD, bold=False, kind="edit")
+            assert stdout.getvalue().startswith("  msg\n")
+            assert not self.reporter._out_buf
+
+    def test_flush(self):
+        with sysu.std_redirect(sysu.STD.OUT) as stdout:
+            self.reporter.secho("msg1", bold=False, kind="edit")
+            self.reporter.secho("msg2", bold=False, kind="success")
+            assert stdout.getvalue() == ""
+            self.reporter.flush()
+            assert stdout.getvalue() == "  msg1\n  msg2\n"
+            self.reporter.flush()
+            assert stdout.getvalue() == "  msg1\n  msg2\n"
+
+    def test_flush_stderr(self):
+        with sysu.std_redirect(sysu.STD.ERR) as stderr:
+            self.reporter.secho("msg1", bold=False, kind="warning")
+            self.reporter.secho("msg2", bold=False, kind="error")
+            assert stderr.getvalue() == ""
+            self.reporter.flush()
+            assert stderr.getvalue() == "  msg1\n  msg2\n"
+
+    def test_counters(self):
+        self.reporter._changed_files = 2
+        self.reporter._failures = 1
+        assert self.reporter.counters == (0, 0, 2, 0, 0, 0, 1, 0)
+
+    def test_merge(self):
+        self.reporter._changed_files = 1
+        with sysu.std_redirect(sysu.STD.OUT) as stdout:
+            with sysu.std_redirect(sysu.STD.ERR) as stderr:
+                self.reporter.secho("msg1", bold=False, kind="edit")
+                self.reporter.merge((1, 0, 1, 2, 0, 0, 1, 0), "  msg2\n", "  err\n")
+                assert stdout.getvalue() == ""
+                self.reporter.flush()
+                assert stdout.getvalue() == "  msg1\n  msg2\n"
+                assert stderr.getvalue() == "  err\n"
+        assert self.reporter.counters == (1, 0, 2, 2, 0, 0, 1, 0)
+
+    def test_merge_drops_str_cache(self):
+        self.reporter._unchanged_files = 1
+        with sysu.std_redirect(sysu.STD.OUT):
+            assert "1 file left unchanged" in str(self.reporter)
+            self.reporter.merge((0, 0, 0, 1, 0, 0, 0, 0))
+            assert "2 files left unchanged" in str(self.reporter)
+
     def test_colored_unified_diff(self):
         original_lines = ["import x, y\n", "print()"]
         fixed_lines = ["import x\n", "print()"]
@@ -63,6 +130,48 @@ class TestReport:
                 "\n"
             )
 
+    def test_colored_unified_diff_context(self):
+        original_lines = [f"x{i} = {i}\n" for i in range(20)]
+        fixed_lines = original_lines.copy()
+        del fixed_lines[10]
+        with sysu.std_redirect(sysu.STD.OUT) as stdout:
+            report.Report.colored_unified_diff(
+                Path("file_path"), original_lines, fixed_lines
+            )
+            assert stdout.getvalue() == (
+                "--- original/ file_path\n"
+                "+++ fixed/ file_path\n"
+                "@@ -8,7 +8,6 @@\n"
+                " x7 = 7\n"
+                " x8 = 8\n"
+                " x9 = 9\n"
+                "-x10 = 10\n"
+                " x11 = 11\n"
+                " x12 = 12\n"
+                " x13 = 13\n"
+                "\n"
+            )
+
+    def test_colored_unified_diff_matches_difflib(self):
+        # Ambiguous alignments (runs of blank lines) keep difflib's output.
+        original_lines = ["import x\n", "\n", "\n", "import y\n", "\n", "\n", "y\n"]
+        fixed_lines = ["\n", "\n", "import y\n", "\n", "\n", "y\n"]
+        expec_diff = "".join(
+            difflib.unified_diff(
+                original_lines,
+                fixed_lines,
+                fromfile="original/ file_path",
+                tofile="fixed/ file_path",
+                n=3,
+                lineterm="\n",
+            )
+        )
+        with sysu.std_redirect(sysu.STD.OUT) as stdout:
+            report.Report.colored_unified_diff(
+                Path("file_path"), original_lines, fixed_lines
+            )
+            assert stdout.getvalue() == expec_diff.rstrip("\n ") + "\n\n"
+
     def test_output_stdin_to_stdout(self):
         fixed_lines = ["import x\n", "print()"]
         with sysu.std_redirect(sysu.STD.OUT) as stdout:
@@ -126,9 +235,10 @@ class TestReport:
         ],
     )
     def test_removed_import(self, mode, is_out):
-        setattr(self.configs, mode, True)
+        self.set_modes(mode)
         with sysu.std_redirect(sysu.STD.OUT) as stdout:
             self.reporter.removed_import(Path(""), self.impt, self.alias)
+            self.reporter.flush()
             assert bool(stdout.getvalue()) == is_out
             assert self.reporter._removed_imports == 1
             assert self.reporter._file_removed_imports == 1
@@ -145,9 +255,10 @@ class TestReport:
         ],
     )
     def test_expanded_star(self, mode, is_out):
-        setattr(self.configs, mode, True)
+        self.set_modes(mode)
         with sysu.std_redirect(sysu.STD.OUT) as stdout:
             self.reporter.expanded_star(Path(""), self.impt)
+            self.reporter.flush()
             assert bool(stdout.getvalue()) == is_out
             assert self.reporter._expanded_stars == 1
             assert self.reporter._file_expanded_stars == 1
@@ -173,7 +284,7 @@ class TestReport:
         ],
     )
     def test_changed_file(self, mode, is_out):
-        setattr(self.configs, mode, True)
+        self.set_modes(mode)
         with sysu.std_redirect(sysu.STD.OUT) as stdout:
             with self.assert_file_counters_reseted():
                 self.reporter.changed_file(Path(""))
@@ -192,13 +303,22 @@ class TestReport:
         ],
     )
     def test_unchanged_file(self, mode, is_out):
-        setattr(self.configs, mode, True)
+        self.set_modes(mode)
         with sysu.std_redirect(sysu.STD.OUT) as stdout:
             with self.assert_file_counters_reseted():
                 self.reporter.unchanged_file(Path(""))
                 assert bool(stdout.getvalue()) == is_out
                 assert self.reporter._unchanged_files == 1
 
+    def test_unchanged_file_after_failure(self):
+        self.set_modes("verbose")
+        with sysu.std_redirect(sysu.STD.ERR):
+            self.reporter.failure("", Path(""))
+        with sysu.std_redirect(sysu.STD.OUT) as stdout:
+            self.reporter.unchanged_file(Path(""))
+            assert stdout.getvalue() == ""
+            assert not self.reporter._file_failed
+
     @pytest.mark.parametrize(
         "mode, is_err",
         [
@@ -211,9 +331,10 @@ class TestReport:
         ],
     )
     def test_ignored_path(self, mode, is_err):
-        setattr(self.configs, mode, True)
+        self.set_modes(mode)
         with sysu.std_redirect(sysu.STD.ERR) as stderr:
             self.reporter.ignored_path(Path(""), None)
+            self.reporter.flush()
             assert bool(stderr.getvalue()) == is_err
             assert self.reporter._ignored_paths == 1
 
@@ -229,9 +350,10 @@ class TestReport:
         ],
     )
     def test_ignored_import(self, mode, is_err):
-        setattr(self.configs, mode, True)
+        self.set_modes(mode)
         with sysu.std_redirect(sysu.STD.ERR) as stderr:
             self.reporter.ignored_import(Path(""), self.impt, False)
+            self.reporter.flush()
             assert bool(stderr.getvalue()) == is_err
             assert self.reporter._ignored_imports == 1
 
@@ -247,11 +369,12 @@ class TestReport:
         ],
     )
     def test_failure(self, mode, is_err):
-        setattr(self.configs, mode, True)
+        self.set_modes(mode)
         with sysu.std_redirect(sysu.STD.ERR) as stderr:
             self.reporter.failure("", Path(""))
             assert bool(stderr.getvalue()) == is_err
             assert self.reporter._failures == 1
+            assert self.reporter._file_failed
 
     @pytest.mark.parametrize(
         "mode, is_err",
@@ -265,9 +388,10 @@ class TestReport:
         ],
     )
     def test_init_without_all_warning(self, mode, is_err):
-        setattr(self.configs, mode, True)
+        self.set_modes(mode)
         with sysu.std_redirect(sysu.STD.ERR) as stderr:
             self.reporter.init_without_all_warning(Path(""))
+            self.reporter.flush()
             assert bool(stderr.getvalue()) == is_err
             assert self.reporter._undecidable_case == 1
 
@@ -282,9 +406,10 @@ class TestReport:
         ],
     )
     def test_exit_code(self, _failures, _changed_files, check, expec_code):
+        self.configs.check = check
+        self.set_modes()
         self.reporter._failures = _failures
         self.reporter._changed_files = _changed_files
-        self.configs.check = check
         assert self.reporter.exit_code == expec_code
 
     @pytest.mark.parametrize(
@@ -416,10 +541,9 @@ class TestReport:
             "_ignored_imports",
             "_ignored_paths",
         )
+        self.set_modes(mode, output_mode)
         for name, val in zip(counters_order, counters):
             setattr(self.reporter, name, val)
-        for mod in (mode, output_mode):
-            setattr(self.configs, mod, True)
         with pytest.raises(err):
             with sysu.std_redirect(sysu.STD.OUT):
                 str_report = str(self.reporter)
@@ -431,3 +555,11 @@ class TestReport:
                     assert snippet in str_report
             else:
                 assert expec_in_out in str_report
+
+    def test_str_dunder_cache(self):
+        self.reporter._unchanged_files = 1
+        with sysu.std_redirect(sysu.STD.OUT):
+            str_report = str(self.reporter)
+            assert str(self.reporter) is str_report
+            self.reporter.changed_file(Path(""))
+            assert "1 file was changed" in str(self.reporter)
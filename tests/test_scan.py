@@ -1,6 +1,7 @@
 """pycln/utils/scan.py tests."""
 # pylint: disable=R0201,W0613
 import ast
+import os
 import sys
 from importlib import import_module
 from pathlib import Path
@@ -9,7 +10,7 @@ from unittest import mock
 
 import pytest
 
-from pycln.utils import _nodes, scan
+from pycln.utils import _nodes, iou, scan
 from pycln.utils._exceptions import UnexpandableImportStar, UnparsableFile
 
 from .utils import sysu
@@ -32,6 +33,16 @@ class TestDataclasses:
         source_stats = scan.SourceStats({"name"}, {"attr"}, {"skip"})
         assert list(source_stats) == [{"name"}, {"attr"}]
 
+    @pytest.mark.parametrize(
+        "stats",
+        [
+            pytest.param(scan.ImportStats(set(), set()), id="ImportStats"),
+            pytest.param(scan.SourceStats(set(), set(), set()), id="SourceStats"),
+        ],
+    )
+    def test_slots(self, stats):
+        assert not hasattr(stats, "__dict__")
+
 
 class AnalyzerTestCase:
 
@@ -211,6 +222,10 @@ class TestSourceAnalyzer(AnalyzerTestCase):
                 {"x", "y", "z"},
                 id="normal attrs",
             ),
+            pytest.param("a.b.c.d\n", {"b", "c", "d"}, id="attrs chain"),
+            pytest.param(
+                "x().y.z(i.j).k\n", {"y", "z", "j", "k"}, id="attrs chain - call"
+            ),
             pytest.param("import k.r\n", None, id="no attrs"),
         ],
     )
@@ -923,13 +938,7 @@ class TestImportablesAnalyzer(AnalyzerTestCase):
 
     """`ImportablesAnalyzer` class tests."""
 
-    def _assert_not_importables(self, not_importables: set, expec_not_importables: set):
-        str_set = {(n.id if hasattr(n, "id") else n) for n in not_importables}
-        assert str_set == expec_not_importables
-
-    def _assert_importables_and_not(
-        self, code: str, expec_importables: set, expec_not_importables=frozenset()
-    ):
+    def _assert_importables(self, code: str, expec_importables: set):
         analyzer = scan.ImportablesAnalyzer(Path(__file__))
         analyzer.visit(ast.parse(code))
         importables = analyzer.get_stats()
@@ -939,7 +948,6 @@ class TestImportablesAnalyzer(AnalyzerTestCase):
             )
         else:
             assert importables
-        self._assert_not_importables(analyzer._not_importables, expec_not_importables)
 
     @pytest.mark.parametrize(
         "code, expec_importables",
@@ -957,7 +965,7 @@ class TestImportablesAnalyzer(AnalyzerTestCase):
         ],
     )
     def test_visit_Assign(self, code, expec_importables):
-        self._assert_importables_and_not(code, expec_importables)
+        self._assert_importables(code, expec_importables)
 
     @pytest.mark.parametrize(
         "code, expec_importables",
@@ -975,7 +983,7 @@ class TestImportablesAnalyzer(AnalyzerTestCase):
         ],
     )
     def test_visit_AugAssign(self, code, expec_importables):
-        self._assert_importables_and_not(code, expec_importables)
+        self._assert_importables(code, expec_importables)
 
     @pytest.mark.parametrize(
         "code, expec_importables",
@@ -993,7 +1001,7 @@ class TestImportablesAnalyzer(AnalyzerTestCase):
         ],
     )
     def test_visit_Expr(self, code, expec_importables):
-        self._assert_importables_and_not(code, expec_importables)
+        self._assert_importables(code, expec_importables)
 
     @pytest.mark.parametrize(
         "code, expec_importables",
@@ -1006,7 +1014,7 @@ class TestImportablesAnalyzer(AnalyzerTestCase):
         ],
     )
     def test_visit_Import(self, code, expec_importables):
-        self._assert_importables_and_not(code, expec_importables)
+        self._assert_importables(code, expec_importables)
 
     @pytest.mark.parametrize(
         "code, expec_importables",
@@ -1029,88 +1037,144 @@ class TestImportablesAnalyzer(AnalyzerTestCase):
         ],
     )
     def test_visit_ImportFrom(self, code, expec_importables):
-        self._assert_importables_and_not(code, expec_importables)
+        self._assert_importables(code, expec_importables)
+
+    def test_visit_ImportFrom_star_not_mutated(self):
+        tree = ast.parse("from os import *\n")
+        analyzer = scan.ImportablesAnalyzer(Path(__file__))
+        analyzer.visit(tree)
+        assert "path" in analyzer.get_stats()
+        assert [a.name for a in tree.body[0].names] == ["*"]  # type: ignore
 
     @pytest.mark.parametrize(
-        "code, expec_importables, expec_not_importables",
+        "code, expec_importables",
         [
             pytest.param(
                 ("def foo():\n" "    bar = 'x'\n"),
                 {"foo"},
-                {"bar"},
                 id="function",
             ),
             pytest.param(
                 ("async def foo():\n" "    bar = 'x'\n"),
                 {"foo"},
-                {"bar"},
                 id="async-function",
             ),
+            pytest.param(
+                (
+                    "def foo():\n"
+                    "    import bar\n"
+                    "    for i in bar.x:\n"
+                    "        def baz():\n"
+                    "            pass\n"
+                ),
+                {"foo"},
+                id="function, nested names",
+            ),
+            pytest.param(
+                (
+                    "class Foo:\n"
+                    "    def bar():\n"
+                    "        pass\n"
+                    "def bar():\n"
+                    "    pass\n"
+                ),
+                {"Foo", "bar"},
+                id="function, same name as a method",
+            ),
         ],
     )
-    def test_visit_FunctionDef(self, code, expec_importables, expec_not_importables):
-        self._assert_importables_and_not(code, expec_importables, expec_not_importables)
+    def test_visit_FunctionDef(self, code, expec_importables):
+        self._assert_importables(code, expec_importables)
 
     @pytest.mark.parametrize(
-        "code, expec_importables, expec_not_importables",
+        "code, expec_importables",
         [
             pytest.param(
                 ("class Foo:\n" "    bar = 'x'\n" "    def foo():\n" "        pass\n"),
                 {"Foo"},
-                {"bar", "foo"},
                 id="class",
-            )
+            ),
+            pytest.param(
+                ("class Foo:\n" "    class Bar:\n" "        baz = 1\n"),
+                {"Foo"},
+                id="class, nested class",
+            ),
         ],
     )
-    def test_visit_ClassDef(self, code, expec_importables, expec_not_importables):
-        self._assert_importables_and_not(code, expec_importables, expec_not_importables)
+    def test_visit_ClassDef(self, code, expec_importables):
+        self._assert_importables(code, expec_importables)
 
     @pytest.mark.parametrize(
         "code, expec_importables",
-        [pytest.param("x, y, z = 'x', 'y', 'z'", {"x", "y", "z"}, id="normal names")],
-    )
-    def test_visit_Name(self, code, expec_importables):
-        self._assert_importables_and_not(code, expec_importables)
-
-    @pytest.mark.parametrize(
-        "code, expec_not_importables",
         [
+            pytest.param("x, y, z = 'x', 'y', 'z'", {"x", "y", "z"}, id="normal names"),
             pytest.param(
-                ("def foo():\n" "    bar = 'x'\n"),
-                {"bar"},
-                id="function, name",
+                ("if x:\n" "    y = 1\n" "for z in y:\n" "    pass\n"),
+                {"y", "z"},
+                id="module level blocks",
             ),
             pytest.param(
-                ("async def foo():\n" "    bar = 'x'\n"),
-                {"bar"},
-                id="async function, name",
+                "x = [i for i in range(3)]\ny = lambda j: j\n",
+                {"x", "y"},
+                id="comprehension/lambda scopes",
             ),
             pytest.param(
-                ("def foo():\n" "    def bar():\n" "        pass\n"),
-                {"bar"},
-                id="function, function",
+                "x, [y, *z] = i.j = k[0] = 'x', ['y']\n",
+                {"x", "y", "z"},
+                id="nested/starred/attr/subscript targets",
             ),
             pytest.param(
-                ("class Foo:\n" "    bar = 'x'\n"),
-                {"bar"},
-                id="class, name",
+                ("x: int = 1\n" "y += 1\n" "with i as (j, k), m:\n" "    pass\n"),
+                {"x", "y", "j", "k"},
+                id="ann-assign, aug-assign, with",
             ),
             pytest.param(
-                ("class Foo:\n" "    def bar():\n" "        pass\n"),
-                {"bar"},
-                id="class, function",
+                "if (x := 1):\n    pass\n",
+                {"x"},
+                id="assignment expression",
+                marks=pytest.mark.skipif(
+                    not PY38_PLUS,
+                    reason="This feature is only available in Python >=3.8.",
+                ),
             ),
             pytest.param(
-                ("class Foo:\n" "    class Bar:\n" "        pass\n"),
-                {"Bar"},
-                id="class, class",
+                "x = [y := f(i) for i in d]\n" "{j: (k := j) for j in d}\n",
+                {"x", "y", "k"},
+                id="assignment expression in comprehension",
+                marks=pytest.mark.skipif(
+                    not PY38_PLUS,
+                    reason="This feature is only available in Python >=3.8.",
+                ),
+            ),
+            pytest.param(
+                "def f():\n    [y := i for i in d]\n" "g = lambda: [(z := 1)]\n",
+                {"f", "g"},
+                id="assignment expression in function, lambda",
+                marks=pytest.mark.skipif(
+                    not PY38_PLUS,
+                    reason="This feature is only available in Python >=3.8.",
+                ),
             ),
         ],
     )
-    def test_compute_not_importables(self, code, expec_not_importables):
-        analyzer = scan.ImportablesAnalyzer(Path(""))
-        analyzer._compute_not_importables(ast.parse(code).body[0])
-        self._assert_not_importables(analyzer._not_importables, expec_not_importables)
+    def test_add_store_names(self, code, expec_importables):
+        self._assert_importables(code, expec_importables)
+
+    @pytest.mark.parametrize(
+        "named_exprs, expec_importables",
+        [
+            pytest.param(True, {"x", "y", "z"}, id="visit expressions"),
+            pytest.param(False, {"x", "y"}, id="skip expressions"),
+        ],
+    )
+    def test_named_exprs(self, named_exprs, expec_importables):
+        code = "x = [(z := 1)]\nif x:\n    y = 2\n"
+        if not PY38_PLUS:
+            code = "x = [1]\nif x:\n    y = 2\n"
+            expec_importables = {"x", "y"}
+        analyzer = scan.ImportablesAnalyzer(Path(__file__), named_exprs)
+        analyzer.visit(ast.parse(code))
+        assert self.normalize_set(analyzer.get_stats()) == expec_importables
 
 
 class TestSideEffectsAnalyzer:
@@ -1226,6 +1290,21 @@ class TestSideEffectsAnalyzer:
                 scan.HasSideEffects.MAYBE,
                 id="unknown imports (third party)",
             ),
+            pytest.param(
+                "import antigravity\nimport os\n",
+                scan.HasSideEffects.YES,
+                id="known side effects are final",
+            ),
+            pytest.param(
+                "import unknown\nimport os\n",
+                scan.HasSideEffects.MAYBE,
+                id="unknown imports are not cleared",
+            ),
+            pytest.param(
+                "import unknown\nprint()\n",
+                scan.HasSideEffects.YES,
+                id="unknown imports then a call",
+            ),
         ],
     )
     def test_visit_Import(self, code, expec_has_side_effects):
@@ -1325,13 +1404,156 @@ class TestScanFunctions(AnalyzerTestCase):
             assert self.normalize_set(names)
             raise sysu.Pass()
 
+    @mock.patch(MOCK % "iou.safe_read_bytes")
+    def test_expand_import_star_os_error(self, safe_read_bytes):
+        scan.get_importables.cache_clear()
+        safe_read_bytes.side_effect = IsADirectoryError(21, "Is a directory")
+        with pytest.raises(UnexpandableImportStar):
+            node = ast.parse("from pycln import *\n").body[0]
+            scan.expand_import_star(node, Path(__file__))
+        scan.get_importables.cache_clear()
+
     @mock.patch(MOCK % "ImportablesAnalyzer.visit")
     def test_expand_import_star_stackoverflow(self, tree_visiting):
+        scan.get_importables.cache_clear()
         tree_visiting.side_effect = RecursionError()
         with pytest.raises(UnexpandableImportStar):
             node = ast.parse("from pycln import *\n").body[0]
             scan.expand_import_star(node, Path(__file__))
 
+    @pytest.mark.parametrize(
+        "code, modules, expec_name",
+        [
+            pytest.param("cast", None, "cast", id="name"),
+            pytest.param("typing.cast", None, "cast", id="typing attr"),
+            pytest.param("x.cast", None, "", id="other attr"),
+            pytest.param("a.typing.cast", None, "", id="nested attr"),
+            pytest.param("f().cast", None, "", id="call attr"),
+            pytest.param(
+                "typing_extensions.TypeAlias",
+                scan.TYPING_MODULES,
+                "TypeAlias",
+                id="typing_extensions attr",
+            ),
+        ],
+    )
+    def test_get_typing_name(self, code, modules, expec_name):
+        node = ast.parse(code, mode="eval").body
+        if modules is None:
+            assert scan.get_typing_name(node) == expec_name
+        else:
+            assert scan.get_typing_name(node, modules) == expec_name
+
+    @pytest.mark.parametrize(
+        "code, expec_strs",
+        [
+            pytest.param("['x', 'y']", ["x", "y"], id="strings"),
+            pytest.param("('x', 1, y, '', b'z')", ["x"], id="mixed"),
+            pytest.param("[]", [], id="empty"),
+        ],
+    )
+    def test_get_str_elts(self, code, expec_strs):
+        elts = ast.parse(code).body[0].value.elts
+        assert scan.get_str_elts(elts) == expec_strs
+
+    @pytest.mark.parametrize(
+        "code, expec_str",
+        [
+            pytest.param("'x'", "x", id="str"),
+            pytest.param("b'x'", "", id="bytes"),
+            pytest.param("1", "", id="int"),
+            pytest.param("x", "", id="name"),
+        ],
+    )
+    def test_get_str_value(self, code, expec_str):
+        node = ast.parse(code, mode="eval").body
+        assert scan.get_str_value(node) == expec_str
+        assert scan.get_str_value(None) == ""
+
+    @pytest.mark.parametrize(
+        "cls, expec_fields",
+        [
+            pytest.param(ast.Name, (), id="Name"),
+            pytest.param(ast.Constant, (), id="Constant"),
+            pytest.param(ast.Attribute, ("value",), id="Attribute"),
+            pytest.param(ast.keyword, ("value",), id="keyword"),
+            pytest.param(ast.Assign, ("targets", "value"), id="Assign"),
+        ],
+    )
+    def test_get_child_fields(self, cls, expec_fields):
+        assert scan.get_child_fields(cls) == expec_fields
+        assert scan.get_child_fields(cls) is scan.get_child_fields(cls)
+
+    def test_parse_file(self, tmp_path):
+        path = tmp_path / "module.py"
+        path.write_text("x = 1\n")
+        tree = scan.parse_file(path)
+        assert tree.body[0].targets[0].id == "x"  # type: ignore
+        #: Not memoized.
+        path.write_text("y = 2\n")
+        new_tree = scan.parse_file(path)
+        assert new_tree.body[0].targets[0].id == "y"  # type: ignore
+
+    @pytest.mark.parametrize(
+        "code, expec_named_exprs",
+        [
+            pytest.param("x = 1\n", False, id="no :="),
+            pytest.param("x = ':='\n", PY38_PLUS, id=":= in a string"),
+        ],
+    )
+    def test_parse_file_named_exprs(self, tmp_path, code, expec_named_exprs):
+        scan.get_importables.cache_clear()
+        path = tmp_path / "module.py"
+        path.write_text(code)
+        stamp = scan.get_file_stamp(path)
+        tree = scan.parse_file(path)
+        assert getattr(tree, scan._NAMED_EXPRS_ATTR) is expec_named_exprs
+        #: `get_importables` reuses the flag, the file is read only once.
+        with mock.patch(
+            MOCK % "iou.safe_read_bytes", wraps=iou.safe_read_bytes
+        ) as safe_read_bytes:
+            assert scan.get_importables(path, stamp) == frozenset({"x"})
+            assert safe_read_bytes.call_count == 1
+        scan.get_importables.cache_clear()
+
+    def test_get_file_stamp(self, tmp_path):
+        path = tmp_path / "module.py"
+        path.write_text("x = 1\n")
+        st = os.stat(path)
+        assert scan.get_file_stamp(path) == (st.st_mtime_ns, 6)
+        assert scan.get_file_stamp(tmp_path / "not_exists.py") == (-1, -1)
+
+    @mock.patch(MOCK % "ImportablesAnalyzer.visit")
+    @mock.patch(MOCK % "parse_ast")
+    def test_expand_import_star_parse_once(self, parse_ast, visit):
+        scan.get_importables.cache_clear()
+        parse_ast.return_value = ast.parse("x = 1\n")
+        for _ in range(3):
+            node = ast.parse("from pycln import *\n").body[0]
+            scan.expand_import_star(node, Path(__file__))
+        assert parse_ast.call_count == 1
+        assert visit.call_count == 1
+        scan.get_importables.cache_clear()
+
+    def test_get_importables(self, tmp_path):
+        scan.get_importables.cache_clear()
+        path = tmp_path / "module.py"
+        path.write_text("x = 1\n")
+        os.utime(path, ns=(0, 0))
+        importables = scan.get_importables(path, scan.get_file_stamp(path))
+        assert importables == frozenset({"x"})
+        assert scan.get_importables(path, scan.get_file_stamp(path)) is importables
+        #: Same mtime, different size.
+        path.write_text("yy = 2\n")
+        os.utime(path, ns=(0, 0))
+        importables = scan.get_importables(path, scan.get_file_stamp(path))
+        assert importables == frozenset({"yy"})
+        if PY38_PLUS:
+            path.write_text("if (zzz := 3):\n    pass\n")
+            importables = scan.get_importables(path, scan.get_file_stamp(path))
+            assert importables == frozenset({"zzz"})
+        scan.get_importables.cache_clear()
+
     def _assert_ast_equal(
         self,
         code: str,